@@ -0,0 +1,45 @@
+"""Benchmark and guard the import time of easy_gar.
+
+Run with ``python -m benchmarks.bench_import [budget_ms]``. Exits with an error
+if importing easy_gar loads any heavy dependency, or if the median import time
+exceeds the budget.
+"""
+
+import statistics
+import subprocess
+import sys
+
+HEAVY_MODULES = ["pandas", "numpy", "googleapiclient", "oauth2client", "httplib2"]
+
+SCRIPT = f"""
+import sys, time
+start = time.perf_counter()
+import easy_gar
+elapsed = time.perf_counter() - start
+heavy = [m for m in {HEAVY_MODULES!r} if m in sys.modules]
+print(elapsed * 1000, ",".join(heavy))
+"""
+
+
+def import_easy_gar():
+    """Return the import time in ms and heavy modules loaded, in a new process."""
+    output = subprocess.check_output([sys.executable, "-c", SCRIPT], text=True)
+    elapsed, _, heavy = output.strip().partition(" ")
+    return float(elapsed), [m for m in heavy.split(",") if m]
+
+
+def main(budget_ms=50.0, repeat=10):
+    """Print the median import time and fail on regressions."""
+    results = [import_easy_gar() for _ in range(repeat)]
+    median = statistics.median(elapsed for elapsed, _ in results)
+    heavy = sorted(set(m for _, modules in results for m in modules))
+
+    print(f"import easy_gar: {median:.1f}ms (budget {budget_ms:.1f}ms)")
+    if heavy:
+        sys.exit(f"importing easy_gar loaded heavy modules: {', '.join(heavy)}")
+    if median > budget_ms:
+        sys.exit(f"importing easy_gar took {median:.1f}ms")
+
+
+if __name__ == "__main__":
+    main(*(float(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,60 @@
+"""Benchmark the columnar response parser against the row-tuple parser.
+
+Run with ``python -m benchmarks.bench_parser [n_rows] [cardinality]``.
+"""
+
+import itertools
+import sys
+import time
+
+import pandas as pd
+
+from easy_gar.base import _build_report
+from benchmarks.synthetic import make_pages, make_spec
+
+
+def row_tuple_report(pages, spec):
+    """Return a DataFrame built with the previous row-tuple parser."""
+    rows = itertools.chain.from_iterable(page["data"]["rows"] for page in pages)
+    values = []
+    row_dims = []
+    for row in rows:
+        values.append(tuple(row["metrics"][0]["values"]))
+        row_dims.append(tuple(row["dimensions"]))
+    fieldnames = (metric.alias for metric in spec.metrics)
+    data = zip(fieldnames, zip(*values))
+    names = tuple(dimension.alias for dimension in spec.dimensions)
+    index = pd.MultiIndex.from_tuples(row_dims, names=names)
+    return pd.DataFrame(dict(data), dtype=float, index=index)
+
+
+def columnar_report(pages, spec):
+    """Return a DataFrame built with the columnar parser."""
+    return _build_report(pages, spec).DataFrame
+
+
+def best_of(func, *args, repeat=3):
+    """Return the best wall-clock time of func(*args) in seconds."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main(n_rows=1000000, cardinality=1000):
+    """Print parser timings for a synthetic response of n_rows rows."""
+    spec = make_spec(n_dimensions=2, n_metrics=5)
+    pages = make_pages(spec, n_rows, cardinality=cardinality)
+
+    baseline = best_of(row_tuple_report, pages, spec)
+    columnar = best_of(columnar_report, pages, spec)
+    print(f"rows:       {n_rows} (cardinality {cardinality})")
+    print(f"row-tuple:  {baseline:.3f}s ({n_rows / baseline:,.0f} rows/s)")
+    print(f"columnar:   {columnar:.3f}s ({n_rows / columnar:,.0f} rows/s)")
+    print(f"speedup:    {baseline / columnar:.2f}x")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,232 @@
+"""Benchmark the response-to-DataFrame path against a committed baseline.
+
+Run with ``python -m benchmarks.bench_suite``. Each case parses synthetic
+response pages into a Report with ``_build_report``, and reports throughput
+in rows per second and peak memory in MB. Results are compared with
+``benchmarks/baseline.json``.
+
+Options:
+
+    --quick             only run cases of up to 100,000 rows
+    --cases TEXT        only run cases whose name contains TEXT
+    --repeat N          time each case at least N times and keep the best
+                        (default 3); small cases are timed more often
+    --check             exit with an error if any case regressed, unless the
+                        baseline was saved with other library releases
+    --tolerance F       allowed drop in throughput, as a fraction (default 0.25)
+    --update-baseline   save the results as the new baseline
+
+Throughput depends on the machine, and on how busy it is, so a fixed
+calibration workload is timed in turn with each run of a case. Baseline
+throughput is scaled by how much faster or slower the workload's best time
+was than when the baseline was saved. Peak memory is compared as it is,
+with a fixed 10% tolerance.
+
+A case that regresses is run a second time, and only counts as a regression
+if it regresses again.
+
+Both depend on the versions of Python, NumPy and pandas, which are saved
+with the baseline. Only their major and minor versions have to match. If
+they differ, results are still compared, but no case counts as a
+regression. The committed baseline is saved in the environment Travis
+installs, from requirements.txt.
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from easy_gar.base import _build_report
+from benchmarks.synthetic import make_pages, make_spec
+
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+MEMORY_TOLERANCE = 0.1
+
+QUICK_ROWS = 100000
+
+# Small cases are repeated until they have been timed for this many seconds,
+# as their best time is otherwise too noisy to compare.
+MIN_TIMED_SECONDS = 2.0
+
+# Times the calibration workload is run before each run of a case. It takes
+# only a few milliseconds, so a single run is easily thrown off.
+CALIBRATION_RUNS = 5
+
+
+def _case(n_rows, n_dimensions=2, n_metrics=5, cardinality=1000):
+    name = (
+        f"rows={n_rows} dims={n_dimensions} metrics={n_metrics} card={cardinality}"
+    )
+    return name, n_rows, n_dimensions, n_metrics, cardinality
+
+
+CASES = [
+    # Number of rows.
+    _case(1000),
+    _case(10000),
+    _case(100000),
+    _case(1000000),
+    _case(5000000),
+    # Number of dimensions.
+    _case(100000, n_dimensions=1),
+    _case(100000, n_dimensions=4),
+    _case(100000, n_dimensions=7),
+    # Number of metrics.
+    _case(100000, n_metrics=1),
+    _case(100000, n_metrics=10),
+    # Cardinality of dimension values.
+    _case(100000, cardinality=10),
+    _case(100000, cardinality=100000),
+]
+
+
+def calibration_workload():
+    """Return a function running a fixed pure-Python workload."""
+    rows = [{"values": [str(n), str(n * 2)]} for n in range(20000)]
+    return lambda: [float(value) for row in rows for value in row["values"]]
+
+
+def run_case(n_rows, n_dimensions, n_metrics, cardinality, repeat=3):
+    """Return the throughput in rows/s and peak memory in MB of one case.
+
+    Also returns the best time of the calibration workload, which is timed
+    a few times before each run of the case.
+    """
+    spec = make_spec(n_dimensions=n_dimensions, n_metrics=n_metrics)
+    pages = make_pages(spec, n_rows, cardinality=cardinality, distinct_pages=20)
+    workload = calibration_workload()
+
+    timings = []
+    calibrations = []
+    while len(timings) < repeat or sum(timings) < MIN_TIMED_SECONDS:
+        for _ in range(CALIBRATION_RUNS):
+            start = time.perf_counter()
+            workload()
+            calibrations.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        _build_report(pages, spec)
+        timings.append(time.perf_counter() - start)
+
+    # Memory is traced in a separate run, as tracing slows parsing down.
+    tracemalloc.start()
+    report = _build_report(pages, spec)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del report
+
+    return n_rows / min(timings), peak / 2 ** 20, min(calibrations)
+
+
+def environment():
+    """Return the versions of Python and the libraries parsing depends on."""
+    return {
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "python": platform.python_version(),
+    }
+
+
+def _release(versions):
+    """Return versions with only their major and minor version numbers."""
+    return {name: ".".join(v.split(".")[:2]) for name, v in versions.items()}
+
+
+def load_baseline(path=BASELINE):
+    """Return the saved baseline, or None if there is none."""
+    if not os.path.exists(path):
+        return None
+    with open(path) as f:
+        return json.load(f)
+
+
+def compare(name, result, baseline, tolerance):
+    """Return a comparison with the baseline, and whether the case regressed."""
+    saved = (baseline or {}).get("cases", {}).get(name)
+    if saved is None:
+        return "no baseline", False
+
+    rows_per_s, peak_mb, calibration = result
+    expected = saved["rows_per_s"] * saved["calibration"] / calibration
+    speed = rows_per_s / expected - 1
+    memory = peak_mb / saved["peak_mb"] - 1
+    regressed = speed < -tolerance or memory > MEMORY_TOLERANCE
+    return f"{speed:+7.1%} speed {memory:+7.1%} memory", regressed
+
+
+def main(argv=None):
+    """Run the benchmark cases and compare them with the baseline."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--quick", action="store_true")
+    parser.add_argument("--cases", default="")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--check", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    parser.add_argument("--update-baseline", action="store_true")
+    args = parser.parse_args(argv)
+
+    cases = [
+        case
+        for case in CASES
+        if args.cases in case[0] and not (args.quick and case[1] > QUICK_ROWS)
+    ]
+    baseline = load_baseline()
+    release = _release(environment())
+    comparable = baseline is None or _release(baseline["environment"]) == release
+    if not comparable:
+        print(
+            f"baseline was saved with {baseline.get('environment')}, "
+            f"not {environment()}; regressions are not flagged"
+        )
+
+    results = {}
+    regressions = []
+    for name, *params in cases:
+        result = results[name] = run_case(*params, repeat=args.repeat)
+        comparison, regressed = compare(name, result, baseline, args.tolerance)
+        if regressed and comparable:
+            # A busy moment on the machine can slow one run down, so a
+            # regression only counts if a second run shows it too.
+            result = results[name] = run_case(*params, repeat=args.repeat)
+            comparison, regressed = compare(name, result, baseline, args.tolerance)
+        if regressed and comparable:
+            regressions.append(name)
+            comparison += "  REGRESSION"
+        rows_per_s, peak_mb, _ = result
+        print(
+            f"{name:<45} {rows_per_s:>12,.0f} rows/s {peak_mb:>9.1f} MB  {comparison}"
+        )
+
+    if args.update_baseline:
+        # Cases saved in another environment can't be compared, so are dropped.
+        saved = baseline if baseline is not None and comparable else {"cases": {}}
+        saved["environment"] = environment()
+        saved["cases"].update(
+            {
+                name: {
+                    "rows_per_s": rows_per_s,
+                    "peak_mb": peak_mb,
+                    "calibration": calibration,
+                }
+                for name, (rows_per_s, peak_mb, calibration) in results.items()
+            }
+        )
+        with open(BASELINE, "w") as f:
+            json.dump(saved, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"Saved baseline to {BASELINE}")
+
+    if args.check and regressions:
+        sys.exit(f"{len(regressions)} case(s) regressed")
+
+
+if __name__ == "__main__":
+    main()
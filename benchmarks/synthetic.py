@@ -0,0 +1,74 @@
+"""Synthetic Reporting API v4 responses for benchmarks."""
+
+import random
+
+from easy_gar.base import _ReportSpec
+from easy_gar.metrics import ReportingMetric
+from easy_gar.dimensions import ReportingDimension
+
+FORMATTING_TYPES = ["INTEGER", "FLOAT", "CURRENCY", "PERCENT", "TIME"]
+
+
+def make_spec(n_dimensions=2, n_metrics=3):
+    """Return a _ReportSpec with synthetic metrics and dimensions."""
+    metrics = [
+        ReportingMetric(
+            expression=f"ga:metric{i}",
+            alias=f"Metric {i}",
+            formatting_type=FORMATTING_TYPES[i % len(FORMATTING_TYPES)],
+        )
+        for i in range(n_metrics)
+    ]
+    dimensions = [
+        ReportingDimension(name=f"ga:dimension{i}", alias=f"Dimension {i}")
+        for i in range(n_dimensions)
+    ]
+    body = {
+        "dateRanges": [{"startDate": "7daysAgo", "endDate": "today"}],
+        "metrics": [metric() for metric in metrics],
+        "dimensions": [dimension() for dimension in dimensions],
+    }
+    return _ReportSpec(body, metrics, dimensions, None)
+
+
+def _value(formatting_type, rng):
+    if formatting_type == "INTEGER":
+        return str(rng.randrange(100000))
+    return repr(round(rng.random() * 1000, 4))
+
+
+def make_pages(
+    spec, n_rows, cardinality=1000, page_size=10000, seed=0, distinct_pages=None
+):
+    """Return a list of synthetic response pages for spec.
+
+    Each dimension takes up to ``cardinality`` distinct values. If
+    ``distinct_pages`` is set, only that many pages are generated, and they
+    are repeated to make up ``n_rows`` rows, which keeps very large responses
+    small in memory.
+    """
+    rng = random.Random(seed)
+    levels = [
+        [f"{dimension.name}/{n}" for n in range(cardinality)]
+        for dimension in spec.dimensions
+    ]
+    types = [metric.formatting_type for metric in spec.metrics]
+
+    pages = []
+    for n, start in enumerate(range(0, n_rows, page_size)):
+        count = min(page_size, n_rows - start)
+        if distinct_pages and n >= distinct_pages:
+            rows = pages[n % distinct_pages]["data"]["rows"][:count]
+        else:
+            rows = [
+                {
+                    "dimensions": [rng.choice(level) for level in levels],
+                    "metrics": [{"values": [_value(t, rng) for t in types]}],
+                }
+                for _ in range(count)
+            ]
+        page = {"data": {"rows": rows, "rowCount": n_rows, "isDataGolden": True}}
+        if start + count < n_rows:
+            page["nextPageToken"] = str(start + count)
+        pages.append(page)
+    return pages
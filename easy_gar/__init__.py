@@ -1,6 +1,8 @@
 """Classes and functions for working with Google Analytics Reporting API v4."""
 
-from easy_gar.base import OrderBy, ReportingAPI
+import importlib
+
+from easy_gar.fields import OrderBy
 from easy_gar.metrics import metrics
 from easy_gar.dimensions import dimensions
 from easy_gar.constants import order_type, sampling_level, sort_order
@@ -13,7 +15,25 @@ __all__ = [
     "metrics",
     "OrderBy",
     "order_type",
+    "Report",
     "ReportingAPI",
     "sampling_level",
     "sort_order",
 ]
+
+# Classes that need pandas or the Google API client are imported on first use,
+# so that importing easy_gar stays cheap.
+_lazy = {
+    "AsyncReportingAPI": "easy_gar.aio",
+    "Report": "easy_gar.base",
+    "ReportingAPI": "easy_gar.base",
+}
+
+
+def __getattr__(name):
+    """Import heavy classes on first access."""
+    if name not in _lazy:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_lazy[name]), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,252 @@
+"""Asyncio client for Google Analytics Reporting API v4."""
+
+import asyncio
+import json
+
+import aiohttp
+from apiclient.errors import HttpError
+import httplib2
+
+from easy_gar.base import (
+    _RequestBuilder,
+    _build_planned_report,
+    _combine_views,
+    _default_limiter,
+    _group_compatible,
+    _oauth_credentials,
+    _plan,
+    _service_account_credentials,
+)
+from easy_gar.constants import MAX_REPORT_REQUESTS
+from easy_gar.retry import RetryPolicy, _error_reason, time_budget
+
+BATCH_GET_URL = "https://analyticsreporting.googleapis.com/v4/reports:batchGet"
+
+
+class AsyncReportingAPI(_RequestBuilder):
+    """Asyncio API class.
+
+    Requests are sent over a shared aiohttp session, with up to
+    ``max_concurrency`` batchGet calls in flight at once. Use it as an async
+    context manager, or await ``close()`` when you are done with it.
+
+    Like ``ReportingAPI``, every batchGet call also waits on a
+    ``easy_gar.limits.RequestLimiter``, by default the one shared by the whole
+    process.
+    """
+
+    def __init__(
+        self,
+        view_id,
+        secrets_path=None,
+        secrets_type="oauth",
+        scopes=("https://www.googleapis.com/auth/analytics.readonly",),
+        url=BATCH_GET_URL,
+        max_concurrency=10,
+        limiter=None,
+        retry_policy=None,
+    ):
+        """Init AsyncReportingAPI object.
+
+        If ``secrets_path`` is None, requests are sent without credentials,
+        which is useful against a local endpoint given by ``url``.
+        """
+        self._view_id = view_id
+        self._scopes = scopes
+        self._url = url
+        self._max_concurrency = max_concurrency
+        self._limiter = limiter or _default_limiter
+        self._session = None
+        self._semaphore = None
+        self._credentials = None
+        self.retry_policy = retry_policy or RetryPolicy()
+
+        if secrets_path is not None:
+            credentials = {
+                "oauth": _oauth_credentials,
+                "service": _service_account_credentials,
+            }.get(secrets_type, None)
+
+            if credentials is None:
+                msg = "Invalid secrets_type; must be one of 'oauth' or 'service'"
+                raise ValueError(msg)
+
+            self._credentials = credentials(secrets_path, scopes)
+
+    async def __aenter__(self):
+        """Enter async context."""
+        return self
+
+    async def __aexit__(self, *exc_info):
+        """Close the HTTP session on exiting async context."""
+        await self.close()
+
+    async def close(self):
+        """Close the underlying HTTP session."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def _open(self):
+        """Open the HTTP session, if it is not open yet."""
+        if self._session is None:
+            connector = aiohttp.TCPConnector(limit=self._max_concurrency)
+            self._session = aiohttp.ClientSession(connector=connector)
+            self._semaphore = asyncio.Semaphore(self._max_concurrency)
+
+    async def _headers(self):
+        """Return HTTP headers for a batchGet call."""
+        headers = {"Content-Type": "application/json"}
+        if self._credentials is not None:
+            # Refreshing an expired token is a blocking call.
+            loop = asyncio.get_event_loop()
+            token = await loop.run_in_executor(
+                None, self._credentials.get_access_token
+            )
+            headers["Authorization"] = f"Bearer {token.access_token}"
+        return headers
+
+    async def _request_with_exponential_backoff(self, bodies):
+        """Return Google Analytic Reporting API v4 reponse object."""
+        self._open()
+        payload = json.dumps({"reportRequests": list(bodies)})
+
+        async def request():
+            async with self._semaphore, self._limiter.acquire_async(self._view_id):
+                headers = await self._headers()
+                async with self._session.post(
+                    self._url, data=payload, headers=headers
+                ) as resp:
+                    content = await resp.read()
+                    if resp.status < 400:
+                        return json.loads(content)
+
+            info = {"status": resp.status, "reason": _error_reason(content)}
+            if "Retry-After" in resp.headers:
+                info["retry-after"] = resp.headers["Retry-After"]
+            raise HttpError(httplib2.Response(info), content, uri=self._url)
+
+        return await self.retry_policy.call_async(request)
+
+    async def _get(self, request_body):
+        """Return Google Analytics Reporing API response object."""
+        response = await self._request_with_exponential_backoff([request_body])
+        return response["reports"][0]
+
+    async def _paginate(self, body):
+        """Return every response page for a single report request."""
+        response = await self._get(body)
+        pages = [response]
+        while "nextPageToken" in response:
+            response = await self._get(dict(body, pageToken=response["nextPageToken"]))
+            pages.append(response)
+        return pages
+
+    async def get_report(
+        self,
+        sampling_level=None,
+        start_date="7daysAgo",
+        end_date="today",
+        metrics=None,
+        dimensions=None,
+        order_by=None,
+        name=None,
+        page_size=None,
+        parse_dates=False,
+        compare_to=None,
+    ):
+        """Return an API response object reporting metrics for set dates."""
+        spec = self._prepare(
+            sampling_level=sampling_level,
+            start_date=start_date,
+            end_date=end_date,
+            metrics=metrics,
+            dimensions=dimensions,
+            order_by=order_by,
+            name=name,
+            page_size=page_size,
+            parse_dates=parse_dates,
+            compare_to=compare_to,
+        )
+        parts = _plan(spec)
+        with time_budget(self.retry_policy.deadline):
+            if len(parts) > 1:
+                part_pages = await self._batch_pages([part.body for part in parts])
+            else:
+                part_pages = [await self._paginate(spec.body)]
+        return _build_planned_report(part_pages, parts, spec)
+
+    async def _batch_pages(self, bodies):
+        """Return the response pages for each of several report requests.
+
+        Compatible requests are sent in batchGet calls of up to five report
+        requests, and all batches are in flight at the same time.
+        """
+        pages = [[] for _ in bodies]
+
+        async def fetch(indices):
+            pending = [(i, bodies[i]) for i in indices]
+            while pending:
+                response = await self._request_with_exponential_backoff(
+                    [body for _, body in pending]
+                )
+                batch, pending = pending, []
+                for (i, body), report in zip(batch, response["reports"]):
+                    pages[i].append(report)
+                    if "nextPageToken" in report:
+                        body = dict(body, pageToken=report["nextPageToken"])
+                        pending.append((i, body))
+
+        chunks = [
+            indices[n:n + MAX_REPORT_REQUESTS]
+            for indices in _group_compatible(bodies)
+            for n in range(0, len(indices), MAX_REPORT_REQUESTS)
+        ]
+        await asyncio.gather(*(fetch(chunk) for chunk in chunks))
+        return pages
+
+    async def get_reports(self, specs):
+        """Return a list of Report objects, one for each report spec.
+
+        Each spec is a dict of ``get_report`` keyword arguments. Compatible
+        specs are sent in batchGet calls of up to five report requests, and
+        all batches are in flight at the same time.
+        """
+        specs = [self._prepare(**spec) for spec in specs]
+        plans = [_plan(spec) for spec in specs]
+        with time_budget(self.retry_policy.deadline):
+            pages = await self._batch_pages(
+                [part.body for parts in plans for part in parts]
+            )
+        pages = iter(pages)
+        return [
+            _build_planned_report([next(pages) for _ in parts], parts, spec)
+            for parts, spec in zip(plans, specs)
+        ]
+
+    async def get_report_for_views(self, view_ids, **kwargs):
+        """Return a Report combining the same report for several views.
+
+        Takes the same keyword arguments as ``get_report``. All views are
+        fetched at the same time, and their rows are combined under an extra
+        categorical ``"View ID"`` index level, in the order of ``view_ids``.
+        Repeated view IDs are fetched once.
+
+        A view whose report fails is left out. The returned Report has an
+        ``errors`` dict of the exception raised for each view left out.
+        """
+        view_ids = list(dict.fromkeys(view_ids))
+        # Open the session first, so that every view shares it.
+        self._open()
+        results = await asyncio.gather(
+            *(self._for_view(view_id).get_report(**kwargs) for view_id in view_ids),
+            return_exceptions=True,
+        )
+        frames = {}
+        errors = {}
+        for view_id, result in zip(view_ids, results):
+            if isinstance(result, Exception):
+                errors[view_id] = result
+            else:
+                frames[view_id] = result.DataFrame
+        return _combine_views(frames, view_ids, errors, kwargs.get("name"))
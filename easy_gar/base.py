@@ -1,106 +1,139 @@
 """Base classes."""
 
+from collections import namedtuple
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+import contextvars
+import copy
+import datetime
+import functools
 import itertools
-import time
-import random
+import json
+import os
+import threading
+import warnings
 
-from apiclient.discovery import build
+from apiclient.discovery import build_from_document
 from apiclient.errors import HttpError
 import httplib2
 from oauth2client import client
 from oauth2client import file
 from oauth2client import tools
 from oauth2client.service_account import ServiceAccountCredentials
+import numpy as np
 import pandas as pd
 
 import easy_gar
+from easy_gar.cache import cache_key
+from easy_gar.constants import MAX_DIMENSIONS, MAX_METRICS, MAX_REPORT_REQUESTS
+from easy_gar.dates import (
+    REPORT_DATE_FORMAT,
+    bisect_date_range,
+    contiguous_ranges,
+    resolve_date,
+    split_date_range,
+)
+from easy_gar.fields import Dimension, Metric, OrderBy  # noqa: F401
+from easy_gar.limits import RequestLimiter
+from easy_gar.retry import RetryPolicy, time_budget
+from easy_gar.transport import ServiceTransport
 
 
-class ReportingAPI:
-    """API class."""
+def _oauth_credentials(secrets_path, scopes):
+    """Return OAuth credentials, running the authorization flow if needed."""
+    # Set up a Flow object to be used if we need to authenticate.
+    flow = client.flow_from_clientsecrets(
+        secrets_path, scope=scopes, message=tools.message_if_missing(secrets_path)
+    )
 
-    sampling_level = "DEFAULT"
+    # Prepare credentials.
+    storage = file.Storage("analyticsreporting.dat")
+    credentials = storage.get()
+    if credentials is None or credentials.invalid:
+        credentials = tools.run_flow(flow, storage)
+    return credentials
 
-    def _build_from_oauth_keys(self, secrets_path):
-        # Set up a Flow object to be used if we need to authenticate.
-        flow = client.flow_from_clientsecrets(
-            secrets_path,
-            scope=self._scopes,
-            message=tools.message_if_missing(secrets_path),
-        )
 
-        # Prepare credentials, and authorize HTTP object with them.
-        storage = file.Storage("analyticsreporting.dat")
-        credentials = storage.get()
-        if credentials is None or credentials.invalid:
-            credentials = tools.run_flow(flow, storage)
-        http = credentials.authorize(http=httplib2.Http())
+def _service_account_credentials(secrets_path, scopes):
+    """Return service account credentials."""
+    return ServiceAccountCredentials.from_json_keyfile_name(secrets_path, scopes)
 
-        # Build the analytics reporting v4 service object.
-        self._reporting = build(
-            "analytics",
-            "v4",
-            http=http,
-            discoveryServiceUrl="https://analyticsreporting.googleapis.com/"
-            "$discovery/rest",
-        )
 
-    def _build_from_service_account_keys(self, secrets_path):
-        credentials = ServiceAccountCredentials.from_json_keyfile_name(
-            secrets_path, self._scopes
-        )
+# The analyticsreporting v4 discovery document is bundled with the package, so
+# building a service object needs no network call.
+DISCOVERY_DOCUMENT = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "analyticsreporting.v4.json"
+)
 
-        # Build the analytics reporting v4 service object.
-        self._reporting = build("analyticsreporting", "v4", credentials=credentials)
+# Transports shared between ReportingAPI instances, by secrets. Each key has
+# its own lock, so that building one transport, which may wait on a browser
+# for OAuth, doesn't hold up instances using other keys.
+_services = {}
+_service_locks = {}
+_services_lock = threading.Lock()
 
-    def __init__(
-        self,
-        view_id,
-        secrets_path,
-        secrets_type="oauth",
-        scopes=("https://www.googleapis.com/auth/analytics.readonly",),
-    ):
-        """Init ReportingAPI object."""
-        self._view_id = view_id
-        self._scopes = scopes
 
-        build = {
-            "oauth": self._build_from_oauth_keys,
-            "service": self._build_from_service_account_keys,
-        }.get(
-            secrets_type, None
-        )
+class _SingleFlight:
+    """Share the result of a call between concurrent callers with one key."""
 
-        if build is None:
-            msg = "Invalid secrets_type; must be one of 'oauth' or 'service'"
-            raise ValueError(msg)
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
 
-        build(secrets_path)
+    def do(self, key, fn):
+        """Return fn(), or the result of the call in flight for key."""
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = self._calls[key] = Future()
+        if not leader:
+            return future.result()
 
-    def _request_with_exponential_backoff(self, body):
-        """Return Google Analytic Reporting API v4 reponse object."""
-        errors = [
-            "userRateLimitExceeded",
-            "quotaExceeded",
-            "internalServerError",
-            "backendError",
-        ]
-        for n in range(0, 5):
-            try:
-                return self._reporting.reports().batchGet(
-                    body={"reportRequests": [body]}
-                ).execute()
-
-            except HttpError as err:
-                exception = err
-                if err.resp.reason in errors:
-                    time.sleep((2 ** n)) + random.random()
-                else:
-                    break
+        try:
+            result = fn()
+        except BaseException as err:
+            future.set_exception(err)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+
+# Requests in flight, by transport and normalized request body.
+_in_flight = _SingleFlight()
+
+# Limiter shared by ReportingAPI instances that are not given their own.
+_default_limiter = RequestLimiter()
+
+
+@functools.lru_cache(maxsize=None)
+def _discovery_document(api_endpoint=None):
+    """Return the bundled discovery document.
+
+    If ``api_endpoint`` is given, the document points services at it instead.
+    """
+    with open(DISCOVERY_DOCUMENT) as f:
+        document = f.read()
+    if api_endpoint is None:
+        return document
+
+    service = json.loads(document)
+    service["rootUrl"] = service["baseUrl"] = api_endpoint.rstrip("/") + "/"
+    return json.dumps(service)
 
-        raise exception
 
-    def _get(
+class _RequestBuilder:
+    """Build report request bodies for a view.
+
+    Shared by ``ReportingAPI`` and ``easy_gar.aio.AsyncReportingAPI``.
+    """
+
+    sampling_level = "DEFAULT"
+
+    def _request_body(
         self,
         sampling_level=None,
         start_date=None,
@@ -110,8 +143,9 @@ class ReportingAPI:
         order_by=None,
         page_token=None,
         page_size=None,
+        compare_to=None,
     ):
-        """Return Google Analytics Reporing API response object."""
+        """Return a single reportRequest body."""
         request_body = {
             "samplingLevel": sampling_level or self.sampling_level,
             "viewId": self._view_id,
@@ -120,16 +154,16 @@ class ReportingAPI:
             "dimensions": dimensions,
             "pageSize": page_size and str(page_size) or "10000",
         }
+        if compare_to:
+            start, end = compare_to
+            request_body["dateRanges"].append({"startDate": start, "endDate": end})
         if page_token:
             request_body["pageToken"] = str(page_token)
         if order_by:
             request_body["orderBys"] = [obj() for obj in order_by]
+        return request_body
 
-        # attempt request using exponential backoff
-        response = self._request_with_exponential_backoff(request_body)
-        return response["reports"][0]
-
-    def get_report(
+    def _prepare(
         self,
         sampling_level=None,
         start_date="7daysAgo",
@@ -138,111 +172,927 @@ class ReportingAPI:
         dimensions=None,
         order_by=None,
         name=None,
+        page_size=None,
+        parse_dates=False,
+        compare_to=None,
     ):
-        """Return an API response object reporting metrics for set dates."""
+        """Return a _ReportSpec for a set of get_report arguments."""
         if not dimensions:
             dimensions = [easy_gar.dimensions.date]
 
         # Create GA metric/dimensions objects
-        _metrics = [metric() for metric in metrics]
-        _dimensions = [dimension() for dimension in dimensions]
+        request_metrics = _request_metrics(metrics, order_by)
+        body = self._request_body(
+            sampling_level=sampling_level,
+            start_date=start_date,
+            end_date=end_date,
+            metrics=[metric() for metric in request_metrics],
+            dimensions=[dimension() for dimension in dimensions],
+            order_by=order_by,
+            page_size=page_size,
+            compare_to=compare_to,
+        )
+        return _ReportSpec(
+            body, metrics, dimensions, name, parse_dates, request_metrics
+        )
+
+    def _for_view(self, view_id):
+        """Return a copy of this API object for another view.
+
+        The copy shares the transport, cache, limiter and retry policy of
+        this one.
+        """
+        api = copy.copy(self)
+        api._view_id = view_id
+        return api
+
+
+class ReportingAPI(_RequestBuilder):
+    """API class."""
+
+    def _build_from_oauth_keys(self, secrets_path):
+        credentials = _oauth_credentials(secrets_path, self._scopes)
+        http = credentials.authorize(http=httplib2.Http())
+
+        # Build the analytics reporting v4 service object.
+        document = _discovery_document(self._api_endpoint)
+        service = build_from_document(document, http=http)
+        return ServiceTransport(service, credentials)
+
+    def _build_from_service_account_keys(self, secrets_path):
+        credentials = _service_account_credentials(secrets_path, self._scopes)
+
+        # Build the analytics reporting v4 service object.
+        document = _discovery_document(self._api_endpoint)
+        service = build_from_document(document, credentials=credentials)
+        return ServiceTransport(service, credentials)
+
+    def _build_without_keys(self, secrets_path):
+        # Requests to a local endpoint need no credentials.
+        document = _discovery_document(self._api_endpoint)
+        service = build_from_document(document, http=httplib2.Http())
+        return ServiceTransport(service, None)
+
+    def __init__(
+        self,
+        view_id,
+        secrets_path=None,
+        secrets_type="oauth",
+        scopes=("https://www.googleapis.com/auth/analytics.readonly",),
+        cache=None,
+        limiter=None,
+        retry_policy=None,
+        transport=None,
+        api_endpoint=None,
+    ):
+        """Init ReportingAPI object.
+
+        An instance can be shared between threads. Requests are sent over a
+        pool of HTTP connections, which are kept alive and reused across
+        pages and reports.
+
+        Pass a cache, such as ``easy_gar.cache.DiskCache``, to reuse
+        responses for identical report requests.
+
+        Every batchGet call waits on a ``easy_gar.limits.RequestLimiter``.
+        Unless one is given as ``limiter``, a limiter shared by the whole
+        process is used.
+
+        Pass an ``easy_gar.retry.RetryPolicy`` as ``retry_policy`` to change
+        how failed requests are retried.
+
+        Requests are sent with the ``transport`` attribute. By default, it is
+        a ``easy_gar.transport.ServiceTransport`` built from the secrets.
+        Pass another transport, such as ``easy_gar.transport.ReplayTransport``,
+        to use it instead, in which case no secrets are needed.
+
+        Pass ``api_endpoint`` to send requests to another server than
+        Google's, such as ``easy_gar.simulator.Simulator``. Without secrets,
+        requests to it are not authorized.
+        """
+        self._view_id = view_id
+        self._scopes = scopes
+        self._cache = cache
+        self._limiter = limiter or _default_limiter
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.transport = transport
+        self._api_endpoint = api_endpoint
+        if transport is not None:
+            return
+        if secrets_path is None and api_endpoint is None:
+            msg = "secrets_path is required without a transport or api_endpoint"
+            raise ValueError(msg)
+
+        if secrets_path is None:
+            build = self._build_without_keys
+        else:
+            build = {
+                "oauth": self._build_from_oauth_keys,
+                "service": self._build_from_service_account_keys,
+            }.get(
+                secrets_type, None
+            )
+
+        if build is None:
+            msg = "Invalid secrets_type; must be one of 'oauth' or 'service'"
+            raise ValueError(msg)
+
+        # Share one transport between instances using the same keys.
+        key = (secrets_type, secrets_path, tuple(scopes), api_endpoint)
+        with _services_lock:
+            lock = _service_locks.setdefault(key, threading.Lock())
+        with lock:
+            if key not in _services:
+                _services[key] = build(secrets_path)
+            self.transport = _services[key]
+
+    def close(self):
+        """Close the transport of the instance, if it can be closed.
+
+        The transport is shared with other instances using the same keys.
+        """
+        close = getattr(self.transport, "close", None)
+        if close is not None:
+            close()
+
+    def _request_with_exponential_backoff(self, bodies):
+        """Return Google Analytic Reporting API v4 reponse object.
+
+        Failed requests are retried as decided by ``self.retry_policy``.
+        """
+
+        def request():
+            with self._limiter.acquire(self._view_id):
+                return self.transport.batch_get({"reportRequests": list(bodies)})
+
+        return self.retry_policy.call(request)
+
+    def _get(self, request_body):
+        """Return Google Analytics Reporing API response object.
+
+        Concurrent calls for the same request, from any thread, share a
+        single API call.
+        """
+        report = self._from_cache(request_body)
+        if report is None:
+            key = (id(self.transport), cache_key(request_body))
+            report = _in_flight.do(key, lambda: self._fetch(request_body))
+        return report
+
+    def _fetch(self, request_body):
+        """Return the report for a request body from the API, caching it."""
+        # attempt request using exponential backoff
+        response = self._request_with_exponential_backoff([request_body])
+        report = response["reports"][0]
+        self._to_cache(request_body, report)
+        return report
+
+    def _from_cache(self, request_body):
+        """Return the cached report for a request body, or None."""
+        if self._cache is None:
+            return None
+        return self._cache.get(cache_key(request_body))
+
+    def _to_cache(self, request_body, report):
+        """Cache the report for a request body."""
+        if self._cache is not None:
+            self._cache.set(cache_key(request_body), report)
+
+    def _paginate(self, body, max_workers=None, response=None):
+        """Return every response page for a single report request.
+
+        If ``max_workers`` is set, the page tokens left after the first page
+        are predicted from its ``rowCount`` and fetched concurrently. Should
+        a predicted page be rejected, or not link up with the page before it,
+        the remaining pages are fetched serially by following page tokens.
+
+        Pass the first page as ``response`` if it has already been fetched.
+        """
+        if response is None:
+            response = self._get(body)
+        pages = [response]
+
+        if max_workers and "nextPageToken" in response:
+            pages.extend(self._fetch_predicted_pages(body, response, max_workers))
+            response = pages[-1]
+
+        # Retrieve additional data if response is paginated
+        while "nextPageToken" in response:
+            response = self._get(dict(body, pageToken=response["nextPageToken"]))
+            pages.append(response)
+
+        return pages
+
+    def _paginate_unsampled(self, body, max_workers=None):
+        """Return the response pages for a report request, avoiding sampling.
+
+        If the first page is sampled, the date range is split in half and
+        both halves are fetched concurrently, splitting them again for as
+        long as they are sampled. A single day that is still sampled is
+        returned as it is, with a warning.
+        """
+        response = self._get(body)
+        date_range = body["dateRanges"][0]
+        halves = _is_sampled(response) and bisect_date_range(
+            date_range["startDate"], date_range["endDate"]
+        )
+        if not halves:
+            if _is_sampled(response):
+                msg = f"Report for {date_range['startDate']} is sampled"
+                warnings.warn(msg)
+            return self._paginate(body, max_workers, response=response)
+
+        bodies = [
+            dict(body, dateRanges=[{"startDate": start, "endDate": end}])
+            for start, end in halves
+        ]
+        paginate = _in_context(self._paginate_unsampled)
+        with ThreadPoolExecutor(2) as executor:
+            shards = executor.map(paginate, bodies, [max_workers] * 2)
+            return list(itertools.chain.from_iterable(shards))
+
+    def _fetch_predicted_pages(self, body, response, max_workers):
+        """Return pages fetched concurrently from predicted page tokens."""
+        next_token = response["nextPageToken"]
+        if not next_token.isdigit():
+            return []
+
+        # v4 page tokens are row offsets into the report.
+        row_count = response.get("data", {}).get("rowCount", 0)
+        page_size = int(body["pageSize"])
+        tokens = [str(n) for n in range(int(next_token), row_count, page_size)]
+
+        pages = []
+        with ThreadPoolExecutor(max_workers) as executor:
+            futures = [
+                executor.submit(_in_context(self._get), dict(body, pageToken=token))
+                for token in tokens
+            ]
+            for token, future in zip(tokens, futures):
+                try:
+                    page = future.result()
+                except HttpError:
+                    page = None
+                if page is None or token != next_token:
+                    break
+                pages.append(page)
+                next_token = page.get("nextPageToken")
+
+            for future in futures:
+                future.cancel()
+
+        return pages
+
+    def get_report(
+        self,
+        sampling_level=None,
+        start_date="7daysAgo",
+        end_date="today",
+        metrics=None,
+        dimensions=None,
+        order_by=None,
+        name=None,
+        page_size=None,
+        max_workers=None,
+        shard_by=None,
+        parse_dates=False,
+        compare_to=None,
+        unsampled=False,
+    ):
+        """Return an API response object reporting metrics for set dates.
+
+        Pass ``max_workers`` to fetch the pages of a paginated report
+        concurrently with up to that many threads.
+
+        Pass ``shard_by="day"``, ``"week"`` or ``"month"`` to split the date
+        range into one request per shard. Shards are fetched concurrently,
+        using ``max_workers`` threads, and merged in date order. The report
+        must have a time dimension that tells shards apart, such as
+        ``dimensions.date``, or ``dimensions.year_month`` for monthly shards.
 
-        # Get initial data
-        response = self._get(
+        Pass ``parse_dates=True`` to parse time dimensions, such as
+        ``dimensions.date``, into datetime or period index levels.
+
+        Pass a ``(start_date, end_date)`` tuple as ``compare_to`` to report
+        a second date range in the same requests. Each metric then gets a
+        second column, suffixed " (Comparison)", for that range.
+
+        Pass ``unsampled=True`` to avoid sampled data. Whenever a response is
+        sampled, its date range is split in half and both halves are
+        requested again, until no response is sampled. The report must have
+        a date dimension, such as ``dimensions.date``, so that rows from
+        different date ranges can't overlap.
+        """
+        if shard_by and compare_to:
+            raise ValueError("shard_by cannot be used with compare_to")
+        if unsampled and compare_to:
+            raise ValueError("unsampled cannot be used with compare_to")
+
+        spec = self._prepare(
             sampling_level=sampling_level,
             start_date=start_date,
             end_date=end_date,
-            metrics=_metrics,
-            dimensions=_dimensions,
+            metrics=metrics,
+            dimensions=dimensions,
             order_by=order_by,
+            name=name,
+            page_size=page_size,
+            parse_dates=parse_dates,
+            compare_to=compare_to,
         )
+        names = {dimension.name for dimension in spec.dimensions}
+        if shard_by:
+            date_ranges = split_date_range(start_date, end_date, shard_by)
+            fine = _SHARD_DIMENSIONS[shard_by]
+            if not fine.intersection(names):
+                msg = f"shard_by={shard_by!r} requires one of {', '.join(sorted(fine))}"
+                raise ValueError(msg)
+        if unsampled and not _DAILY_DIMENSIONS.intersection(names):
+            raise ValueError("unsampled requires the ga:date dimension")
+
+        parts = _plan(spec)
+        with time_budget(self.retry_policy.deadline):
+            if shard_by:
+                part_pages = [
+                    self._paginate_ranges(
+                        part.body, date_ranges, max_workers, unsampled
+                    )
+                    for part in parts
+                ]
+            elif unsampled:
+                part_pages = [
+                    self._paginate_unsampled(part.body, max_workers)
+                    for part in parts
+                ]
+            elif len(parts) > 1:
+                part_pages = self._batch_pages([part.body for part in parts])
+            else:
+                part_pages = [self._paginate(spec.body, max_workers=max_workers)]
+
+        return _build_planned_report(part_pages, parts, spec)
+
+    def _paginate_ranges(self, body, date_ranges, max_workers=None, unsampled=False):
+        """Return response pages for each date range, fetched concurrently."""
+        bodies = [
+            dict(body, dateRanges=[{"startDate": start, "endDate": end}])
+            for start, end in date_ranges
+        ]
+        paginate = self._paginate_unsampled if unsampled else self._paginate
+        with ThreadPoolExecutor(max_workers) as executor:
+            shards = executor.map(_in_context(paginate), bodies)
+            return list(itertools.chain.from_iterable(shards))
+
+    def refresh_report(
+        self,
+        store,
+        sampling_level=None,
+        start_date="7daysAgo",
+        end_date="today",
+        metrics=None,
+        dimensions=None,
+        name=None,
+        page_size=None,
+        max_workers=None,
+        refetch_days=2,
+    ):
+        """Return a report, fetching only dates missing from a local store.
+
+        The report must have a date dimension. Rows previously saved in
+        ``store`` for the same report are reused, except for the last
+        ``refetch_days`` stored dates, which are fetched again to pick up
+        late-arriving data. Fetched rows are upserted into the store, along
+        with the dates fetched, so that dates without rows aren't fetched
+        again.
+
+        Stored and fetched rows are merged by sorting on the index, so rows
+        can't be ordered by anything else, and there is no ``order_by``.
+        """
+        spec = self._prepare(
+            sampling_level=sampling_level,
+            start_date=start_date,
+            end_date=end_date,
+            metrics=metrics,
+            dimensions=dimensions,
+            name=name,
+            page_size=page_size,
+        )
+        names = [dimension.name for dimension in spec.dimensions]
+        if "ga:date" not in names:
+            raise ValueError("refresh_report requires the ga:date dimension")
+        level = names.index("ga:date")
+        parts = _plan(spec)
+
+        start, end = resolve_date(start_date), resolve_date(end_date)
+        if start > end:
+            raise ValueError("start_date must not be after end_date")
+
+        # The API leaves out rows where every metric is zero, so the dates
+        # fetched are saved apart from the rows, as the index of a frame.
+        key = cache_key(dict(spec.body, dateRanges=[]))
+        dates_key = f"{key}-dates"
+        stored = store.load(key)
+        fetched_dates = store.load(dates_key) if stored is not None else None
+        known = set()
+        if fetched_dates is not None:
+            known = {
+                datetime.datetime.strptime(date, REPORT_DATE_FORMAT).date()
+                for date in fetched_dates.index
+            }
+
+        # Re-fetch the most recent stored dates, as their data may still change.
+        stale = set(sorted(known)[-refetch_days:] if refetch_days else ())
+
+        days = (end - start).days + 1
+        dates = (start + datetime.timedelta(days=n) for n in range(days))
+        missing = [date for date in dates if date not in known or date in stale]
 
-        if response:
-            rows = response["data"]["rows"]
-            values = (tuple(row["metrics"][0]["values"]) for row in rows)
-            row_dims = (tuple(row["dimensions"]) for row in rows)
-
-            # Retrieve additional data if response is paginated
-            while "nextPageToken" in response.keys():
-                page_token = response["nextPageToken"]
-                args = (start_date, end_date, _metrics, _dimensions, page_token)
-                response = self._get(*args)
-                if response:
-                    rows = response["data"]["rows"]
-                    new_values = (tuple(row["metrics"][0]["values"]) for row in rows)
-                    new_dims = (tuple(row["dimensions"]) for row in rows)
-                    values = itertools.chain(values, new_values)
-                    row_dims = itertools.chain(row_dims, new_dims)
-
-            # Set up report data (for pandas DataFrame)
-            fieldnames = (metric.alias for metric in metrics)
-            data = zip(fieldnames, zip(*values))
-            indices = tuple(row_dims)
-            names = tuple(dimension.alias for dimension in dimensions)
-            index = pd.MultiIndex.from_tuples(indices, names=names)
-            return Report(data, index, name)
-
-
-class Metric:
-    """Base Metric class."""
-
-    def __init__(self, expression=None, alias=None, formatting_type=None):
-        """Init Metric object."""
-        self.expression = expression
-        self.alias = alias
-        self.formatting_type = formatting_type
-
-    def __repr__(self, alias=None, formatting_type=None):
-        """Repr string for class."""
+        if missing:
+            date_ranges = contiguous_ranges(missing)
+            with time_budget(self.retry_policy.deadline):
+                part_pages = [
+                    self._paginate_ranges(part.body, date_ranges, max_workers)
+                    for part in parts
+                ]
+            fetched = _build_planned_report(part_pages, parts, spec).DataFrame
+            if stored is not None:
+                refetched = {date.strftime(REPORT_DATE_FORMAT) for date in missing}
+                keep = ~stored.index.get_level_values(level).isin(refetched)
+                fetched = pd.concat([stored[keep], fetched]).sort_index()
+            store.save(key, fetched)
+            stored = fetched
+
+            known.update(missing)
+            dates = sorted(date.strftime(REPORT_DATE_FORMAT) for date in known)
+            store.save(dates_key, pd.DataFrame(index=pd.Index(dates, name="ga:date")))
+
+        in_range = {
+            (start + datetime.timedelta(days=n)).strftime(REPORT_DATE_FORMAT)
+            for n in range(days)
+        }
+        frame = stored[stored.index.get_level_values(level).isin(in_range)]
+        return Report(frame.items(), frame.index, spec.name)
+
+    def _iter_pages(self, body):
+        """Yield the response pages for a single report request as they arrive."""
+        response = self._get(body)
+        yield response
+        while "nextPageToken" in response:
+            response = self._get(dict(body, pageToken=response["nextPageToken"]))
+            yield response
+
+    def iter_report(
+        self,
+        sampling_level=None,
+        start_date="7daysAgo",
+        end_date="today",
+        metrics=None,
+        dimensions=None,
+        order_by=None,
+        page_size=None,
+        parse_dates=False,
+    ):
+        """Return an iterator of a pandas DataFrame for each page of a report.
+
+        Each DataFrame has the same columns and index levels as
+        ``Report.DataFrame``, and only one page is held in memory at a time.
+        Pages of different requests can't be joined one at a time, so the
+        report can request at most 10 metrics.
+        """
+        spec = self._prepare(
+            sampling_level=sampling_level,
+            start_date=start_date,
+            end_date=end_date,
+            metrics=metrics,
+            dimensions=dimensions,
+            order_by=order_by,
+            page_size=page_size,
+            parse_dates=parse_dates,
+        )
+        if len(_plan(spec)) > 1:
+            msg = f"iter_report can request at most {MAX_METRICS} metrics"
+            raise ValueError(msg)
         return (
-            f"{self.__class__.__name__}('{self.expression}', "
-            f"'{self.alias}', '{self.formatting_type}')"
+            _build_report([page], spec).DataFrame
+            for page in self._iter_pages(spec.body)
         )
 
-    def __str__(self):
-        """String representation of metric name."""
-        return f"{self.expression}"
+    def _batch_pages(self, bodies):
+        """Return the response pages for each of several report requests.
 
-    def __call__(self):
-        raise NotImplementedError
+        Compatible requests are sent together in batchGet calls of up to five
+        report requests, and each request is paginated on its own.
+        """
+        pages = [[] for _ in bodies]
 
+        def add_page(i, body, report, pending):
+            pages[i].append(report)
+            if "nextPageToken" in report:
+                pending.append((i, dict(body, pageToken=report["nextPageToken"])))
 
-class Dimension:
-    """Base Dimension class."""
+        for indices in _group_compatible(bodies):
+            pending = [(i, bodies[i]) for i in indices]
+            while pending:
+                batch = []
+                while pending and len(batch) < MAX_REPORT_REQUESTS:
+                    i, body = pending.pop(0)
+                    report = self._from_cache(body)
+                    if report is None:
+                        batch.append((i, body))
+                    else:
+                        add_page(i, body, report, pending)
+                if not batch:
+                    continue
 
-    def __init__(self, name, alias=""):
-        """Init Dimension object."""
-        self.name = name
-        self.alias = alias
+                response = self._request_with_exponential_backoff(
+                    [body for _, body in batch]
+                )
+                for (i, body), report in zip(batch, response["reports"]):
+                    self._to_cache(body, report)
+                    add_page(i, body, report, pending)
 
-    def __repr__(self):
-        """Repr string for Dimension object."""
-        return f"{self.__class__.__name__}(name='{self.name}', alias='{self.alias}')"
+        return pages
 
-    def __str__(self):
-        """String representation of Dimension object."""
-        return f"{self.name}"
+    def get_reports(self, specs):
+        """Return a list of Report objects, one for each report spec.
 
-    def __call__(self):
-        """Return dictionary to be used in API requests."""
-        return {"name": self.name}
+        Each spec is a dict of ``get_report`` keyword arguments, other than
+        ``max_workers``, ``shard_by`` and ``unsampled``. Specs sharing a
+        sampling level and date range are sent together in batchGet calls of
+        up to five report requests, and each report is paginated on its own.
+        """
+        for spec in specs:
+            unbatched = _UNBATCHED_ARGUMENTS.intersection(spec)
+            if unbatched:
+                msg = f"get_reports specs can't use {', '.join(sorted(unbatched))}"
+                raise ValueError(msg)
+        specs = [self._prepare(**spec) for spec in specs]
+        plans = [_plan(spec) for spec in specs]
+        with time_budget(self.retry_policy.deadline):
+            pages = self._batch_pages(
+                [part.body for parts in plans for part in parts]
+            )
+        pages = iter(pages)
+        return [
+            _build_planned_report([next(pages) for _ in parts], parts, spec)
+            for parts, spec in zip(plans, specs)
+        ]
 
+    def get_report_for_views(self, view_ids, max_views=8, **kwargs):
+        """Return a Report combining the same report for several views.
 
-class OrderBy:
-    """Reporting API orderBy object."""
+        Takes the same keyword arguments as ``get_report``, including
+        ``max_workers`` for the pages of each view. Up to ``max_views`` views
+        are fetched concurrently, and their rows are combined under an extra
+        categorical ``"View ID"`` index level, in the order of ``view_ids``.
+        Repeated view IDs are fetched once.
 
-    def __init__(self, field_name, order_type="VALUE", sort_order="ASCENDING"):
-        """Init OrderBy object."""
-        self.field_name = field_name
-        self.order_type = order_type
-        self.sort_order = sort_order
+        A view whose report fails is left out. The returned Report has an
+        ``errors`` dict of the exception raised for each view left out.
+        """
+        view_ids = list(dict.fromkeys(view_ids))
+        frames = {}
+        errors = {}
+        with ThreadPoolExecutor(max_views) as executor:
+            futures = {
+                executor.submit(
+                    _in_context(self._for_view(view_id).get_report), **kwargs
+                ): view_id
+                for view_id in view_ids
+            }
+            for future in as_completed(futures):
+                view_id = futures[future]
+                try:
+                    frames[view_id] = future.result().DataFrame
+                except Exception as err:
+                    errors[view_id] = err
 
-    def __call__(self):
-        return {
-            "fieldName": str(self.field_name),
-            "orderType": self.order_type,
-            "sortOrder": self.sort_order,
-        }
+        return _combine_views(frames, view_ids, errors, kwargs.get("name"))
+
+    def explain(self, **kwargs):
+        """Return a description of the requests a get_report call would make.
+
+        Takes the same keyword arguments as ``get_report``.
+        """
+        spec = self._prepare(
+            **{k: v for k, v in kwargs.items() if k not in _UNBATCHED_ARGUMENTS}
+        )
+        parts = _plan(spec)
+        calls = -(-len(parts) // MAX_REPORT_REQUESTS)
+        dimensions = ", ".join(str(dimension) for dimension in spec.dimensions)
+        lines = [
+            f"{len(spec.metrics)} metrics, {len(spec.dimensions)} dimensions: "
+            f"{len(parts)} report requests in {calls} batchGet calls"
+        ]
+        for n, part in enumerate(parts, 1):
+            metrics = ", ".join(str(metric) for metric in part.request_metrics)
+            lines.append(f"  request {n}: dimensions {dimensions}; metrics {metrics}")
+        if kwargs.get("shard_by"):
+            date_ranges = split_date_range(
+                kwargs.get("start_date", "7daysAgo"),
+                kwargs.get("end_date", "today"),
+                kwargs["shard_by"],
+            )
+            lines.append(f"  each request is sharded into {len(date_ranges)} ranges")
+        if kwargs.get("unsampled"):
+            lines.append(
+                "  sampled responses are split by date range and requested again, "
+                "which may add requests"
+            )
+        return "\n".join(lines)
+
+
+def _in_context(fn):
+    """Return fn wrapped to run in a copy of the caller's context.
+
+    Worker threads then see the time budget of the call that started them.
+    """
+    context = contextvars.copy_context()
+    return lambda *args, **kwargs: context.copy().run(fn, *args, **kwargs)
+
+
+# get_report arguments that change how requests are sent, rather than what is
+# requested, so get_reports specs can't use them.
+_UNBATCHED_ARGUMENTS = {"max_workers", "shard_by", "unsampled"}
+
+_ReportSpec = namedtuple(
+    "_ReportSpec", "body metrics dimensions name parse_dates request_metrics"
+)
+_ReportSpec.__new__.__defaults__ = (False, None)
+
+
+# Dimensions with a value per day, or finer, which tell date ranges apart.
+_DAILY_DIMENSIONS = {"ga:date", "ga:dateHour", "ga:dateHourMinute"}
+
+# Dimensions whose values each fall within a single shard, by shard_by. Google
+# Analytics weeks start on Sunday, like shards, but ISO weeks don't.
+_SHARD_DIMENSIONS = {
+    "day": _DAILY_DIMENSIONS,
+    "week": _DAILY_DIMENSIONS | {"ga:yearWeek"},
+    "month": _DAILY_DIMENSIONS | {"ga:yearMonth"},
+}
+
+
+def _is_sampled(report):
+    """Return True if a report's data is sampled."""
+    return bool(report.get("data", {}).get("samplesReadCounts"))
+
+
+def _group_compatible(bodies):
+    """Return lists of indices of request bodies that can share a batchGet call."""
+    # The API rejects batches that mix date ranges or sampling levels.
+    groups = {}
+    for i, body in enumerate(bodies):
+        key = (body["samplingLevel"], repr(body["dateRanges"]))
+        groups.setdefault(key, []).append(i)
+    return list(groups.values())
+
+
+def _plan(spec):
+    """Return a list of specs that together request the metrics of spec.
+
+    The API allows at most 10 metrics per request, so longer lists of metrics
+    are split into requests that share the same dimensions. Only the first
+    request, which gets any metrics used for ordering, is ordered.
+    """
+    if len(spec.dimensions) > MAX_DIMENSIONS:
+        msg = f"A report can have at most {MAX_DIMENSIONS} dimensions"
+        raise ValueError(msg)
+
+    requested = spec.request_metrics or spec.metrics
+    if len(requested) <= MAX_METRICS:
+        return [spec]
+
+    ordered = {obj["fieldName"] for obj in spec.body.get("orderBys", ())}
+    requested = sorted(requested, key=lambda metric: str(metric) not in ordered)
+    unordered = {k: v for k, v in spec.body.items() if k != "orderBys"}
+
+    parts = []
+    for n in range(0, len(requested), MAX_METRICS):
+        metrics = requested[n:n + MAX_METRICS]
+        body = dict(spec.body if n == 0 else unordered)
+        body["metrics"] = [metric() for metric in metrics]
+        parts.append(spec._replace(body=body, request_metrics=metrics))
+    return parts
+
+
+# NumPy dtypes for metric values, by formatting type. TIME values are parsed as
+# seconds and then converted to timedeltas.
+_DTYPES = {
+    "INTEGER": np.int64,
+    "FLOAT": np.float64,
+    "CURRENCY": np.float64,
+    "PERCENT": np.float64,
+    "TIME": np.float64,
+}
+
+
+def _parse_metrics(row_pages, metrics, row_count, date_range=0):
+    """Return a NumPy array of values for each metric, for one date range.
+
+    Values are written page by page, straight into arrays preallocated with
+    the dtype of each metric's formatting type. TIME values are left as
+    seconds.
+    """
+    columns = [
+        np.empty(row_count, dtype=_DTYPES.get(metric.formatting_type, np.float64))
+        for metric in metrics
+    ]
+    n_metrics = len(metrics)
+    offset = 0
+    for rows in row_pages:
+        values = [
+            value for row in rows for value in row["metrics"][date_range]["values"]
+        ]
+        for i, column in enumerate(columns):
+            column[offset:offset + len(rows)] = values[i::n_metrics]
+        offset += len(rows)
+    return columns
+
+
+def _request_metrics(metrics, order_by=None):
+    """Return the distinct metrics to request from the API.
+
+    Metrics built with arithmetic are replaced by their base metrics, unless
+    results are ordered by them, which needs the API to compute them.
+    """
+    ordered = {str(obj.field_name) for obj in order_by or ()}
+    requested = {}
+    for metric in metrics:
+        if getattr(metric, "operator", None) and str(metric) not in ordered:
+            for base in metric.base_metrics():
+                requested.setdefault(base.expression, base)
+        else:
+            requested.setdefault(metric.expression, metric)
+    return list(requested.values())
+
+
+def _evaluate(metric, columns):
+    """Return the values of a metric, computed from columns by expression."""
+    if metric.expression in columns:
+        return columns[metric.expression]
+
+    left, right = (_evaluate(operand, columns) for operand in metric.operands)
+    if metric.operator == "+":
+        return left + right
+    if metric.operator == "-":
+        return left - right
+    if metric.operator == "*":
+        return left * right
+
+    # Division by zero gives NaN rather than inf or an error.
+    with np.errstate(divide="ignore", invalid="ignore"):
+        result = np.true_divide(left, right)
+    result[right == 0] = np.nan
+    return result
+
+
+def _parse_time_level(level, dimension):
+    """Return an index level of time dimension values as datetimes or periods.
+
+    Levels of dimensions without a ``time_format`` are returned unchanged.
+    """
+    time_format = getattr(dimension, "time_format", None)
+    if not time_format:
+        return level
+
+    # Week values are parsed as the first day of their week. ISO week
+    # directives need strptime, as pd.to_datetime only takes them from pandas
+    # 0.25, but levels hold each value only once.
+    suffix = "1" if time_format.endswith("%u") else ""
+    level = pd.DatetimeIndex(
+        [datetime.datetime.strptime(value + suffix, time_format) for value in level]
+    )
+
+    time_freq = getattr(dimension, "time_freq", None)
+    return level.to_period(time_freq) if time_freq else level
+
+
+def _parse_dimensions(row_pages, dimensions, row_count, parse_dates=False):
+    """Return a MultiIndex of the dimension values of each row.
+
+    Each dimension is dictionary-encoded into integer codes and sorted levels,
+    so the index holds one string per unique value rather than one per row.
+    With ``parse_dates``, time dimension levels are parsed in one pass over
+    their unique values.
+    """
+    levels = []
+    codes = []
+    for i in range(len(dimensions)):
+        values = np.empty(row_count, dtype=object)
+        offset = 0
+        for rows in row_pages:
+            values[offset:offset + len(rows)] = [row["dimensions"][i] for row in rows]
+            offset += len(rows)
+        level_codes, level = pd.factorize(values, sort=True)
+        if parse_dates:
+            level = _parse_time_level(level, dimensions[i])
+        codes.append(level_codes)
+        levels.append(level)
+
+    # Codes are passed by position, as pandas 0.24 renamed the "labels"
+    # argument to "codes".
+    names = [dimension.alias for dimension in dimensions]
+    return pd.MultiIndex(levels, codes, names=names, verify_integrity=False)
+
+
+def _parse_pages(pages, spec):
+    """Return the requested metric columns and the index.
+
+    Columns are returned as a list with a dict of columns, by expression, for
+    each date range of the request.
+    """
+    row_pages = [page.get("data", {}).get("rows", ()) for page in pages]
+    row_count = sum(len(rows) for rows in row_pages)
+
+    requested = spec.request_metrics or spec.metrics
+    columns = []
+    for date_range in range(len(spec.body["dateRanges"])):
+        parsed = _parse_metrics(row_pages, requested, row_count, date_range)
+        columns.append(
+            {metric.expression: column for metric, column in zip(requested, parsed)}
+        )
+    index = _parse_dimensions(
+        row_pages, spec.dimensions, row_count, parse_dates=spec.parse_dates
+    )
+    return columns, index
+
+
+def _reindex(columns, index, target):
+    """Return columns aligned to a target index, with zeros for missing rows."""
+    positions = index.get_indexer(target)
+    found = positions != -1
+    aligned = {}
+    for expression, values in columns.items():
+        aligned[expression] = np.zeros(len(target), dtype=values.dtype)
+        aligned[expression][found] = values[positions[found]]
+    return aligned
+
+
+def _join_parts(parts):
+    """Return the columns and index of several parsed parts of a report.
+
+    Parts are aligned on their indexes. The API leaves out rows where every
+    metric of a request is zero, so rows missing from a part are zero-filled.
+    """
+    columns, index = parts[0]
+    columns = [dict(range_columns) for range_columns in columns]
+    for part_columns, part_index in parts[1:]:
+        if not part_index.equals(index):
+            target = index.append(part_index.difference(index))
+            columns = [_reindex(c, index, target) for c in columns]
+            part_columns = [_reindex(c, part_index, target) for c in part_columns]
+            index = target
+        for range_columns, range_part_columns in zip(columns, part_columns):
+            range_columns.update(range_part_columns)
+    return columns, index
+
+
+def _report_from_columns(columns, index, spec):
+    """Return a Report object, computing derived metrics from columns.
+
+    Metrics of a comparison date range follow the metrics they compare to.
+    """
+    # Set up report data (for pandas DataFrame)
+    data = []
+    for metric in spec.metrics:
+        for date_range, range_columns in enumerate(columns):
+            values = _evaluate(metric, range_columns)
+            if metric.formatting_type == "TIME":
+                values = pd.to_timedelta(values, unit="s")
+            label = metric.alias if date_range == 0 else f"{metric.alias} (Comparison)"
+            data.append((label, values))
+    return Report(data, index, spec.name)
+
+
+def _build_report(pages, spec):
+    """Return a Report object from the response pages of a report request."""
+    return _report_from_columns(*_parse_pages(pages, spec), spec)
+
+
+def _build_planned_report(part_pages, parts, spec):
+    """Return a Report object from the response pages of each planned part."""
+    if len(parts) == 1:
+        return _build_report(part_pages[0], spec)
+    parsed = [_parse_pages(pages, part) for pages, part in zip(part_pages, parts)]
+    return _report_from_columns(*_join_parts(parsed), spec)
+
+
+def _combine_views(frames, view_ids, errors, name=None):
+    """Return a Report of per-view DataFrames under a "View ID" index level."""
+    view_ids = [view_id for view_id in view_ids if view_id in frames]
+    if not view_ids:
+        report = Report({}, None, name)
+    else:
+        frame = pd.concat(
+            [frames[view_id] for view_id in view_ids],
+            keys=view_ids,
+            names=["View ID"],
+        )
+        views = pd.CategoricalIndex(frame.index.levels[0], categories=view_ids)
+        frame.index = frame.index.set_levels(views, level=0)
+        report = Report(frame.items(), frame.index, name)
+    report.errors = errors
+    return report
 
 
 class Report:
@@ -251,7 +1101,7 @@ class Report:
     def __init__(self, data, index, name=None):
         """Init Report object."""
         self.name = name
-        self.DataFrame = pd.DataFrame(dict(data), dtype=float, index=index)
+        self.DataFrame = pd.DataFrame(dict(data), index=index)
 
     def __repr__(self):
         return repr(self.DataFrame)
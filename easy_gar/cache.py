@@ -0,0 +1,158 @@
+"""Response caches for Google Analytics Reporting API v4.
+
+A cache is any object with ``get(key)`` and ``set(key, report)`` methods,
+where ``report`` is a single report from a batchGet response and ``get``
+returns None on a miss.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+
+from easy_gar.dates import DATE_FORMAT, resolve_date
+
+
+def cache_key(request_body, today=None):
+    """Return a canonical hash of a reportRequest body.
+
+    Relative dates are resolved to absolute dates first, so that a request
+    for ``"7daysAgo"`` is not served from yesterday's cache entry.
+    """
+    date_ranges = [
+        {
+            key: resolve_date(value, today).strftime(DATE_FORMAT)
+            for key, value in date_range.items()
+        }
+        for date_range in request_body.get("dateRanges", ())
+    ]
+    body = dict(request_body, dateRanges=date_ranges)
+    canonical = json.dumps(body, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class DiskCache:
+    """On-disk response cache with size-bounded LRU eviction.
+
+    Reports the API marks as golden never expire. Other reports expire after
+    ``ttl`` seconds, or are not cached at all if ``ttl`` is 0. Once the
+    cache grows beyond ``max_size`` bytes, the least recently used entries
+    are removed.
+
+    The size of the cache is counted when it is opened and kept up to date
+    as entries are written and removed, so the directory is only scanned to
+    evict entries. Eviction is locked per DiskCache object only. Several
+    objects or processes can share a directory, but each counts only its
+    own writes, so the directory may grow beyond ``max_size`` until one of
+    them next evicts.
+    """
+
+    def __init__(self, path=".easy_gar_cache", max_size=2 ** 30, ttl=3600):
+        """Init DiskCache object."""
+        self.path = path
+        self.max_size = max_size
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        os.makedirs(path, exist_ok=True)
+        self._size = sum(size for _, size, _ in self._stats())
+
+    def _path(self, key):
+        return os.path.join(self.path, f"{key}.json")
+
+    def get(self, key):
+        """Return the cached report for key, or None."""
+        path = self._path(key)
+        try:
+            with open(path) as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if entry["expires"] is not None and entry["expires"] < time.time():
+            self._remove(path)
+            return None
+
+        # The modification time doubles as the last access time.
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return entry["report"]
+
+    def set(self, key, report):
+        """Cache a report under key."""
+        golden = report.get("data", {}).get("isDataGolden", False)
+        if not golden and not self.ttl:
+            return
+
+        entry = {"expires": None if golden else time.time() + self.ttl}
+        entry["report"] = report
+
+        # Write atomically, so readers never see a partial entry.
+        data = json.dumps(entry, separators=(",", ":"))
+        fd, tmp_path = tempfile.mkstemp(dir=self.path, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            f.write(data)
+        path = self._path(key)
+        replaced = self._size_of(path)
+        os.replace(tmp_path, path)
+
+        with self._lock:
+            self._size += len(data) - replaced
+            full = self._size > self.max_size
+        if full:
+            self._evict()
+
+    def clear(self):
+        """Remove every cached report."""
+        for entry in self._entries():
+            self._remove(entry.path)
+
+    def _entries(self):
+        return [e for e in os.scandir(self.path) if e.name.endswith(".json")]
+
+    def _stats(self):
+        """Return (mtime, size, path) tuples of the cached entries."""
+        stats = []
+        for entry in self._entries():
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            stats.append((stat.st_mtime, stat.st_size, entry.path))
+        return stats
+
+    def _size_of(self, path):
+        try:
+            return os.path.getsize(path)
+        except OSError:
+            return 0
+
+    def _remove(self, path):
+        size = self._size_of(path)
+        try:
+            os.remove(path)
+        except OSError:
+            return
+        with self._lock:
+            self._size -= size
+
+    def _evict(self):
+        """Remove least recently used entries until under max_size.
+
+        The size of the cache is counted again from the directory, which
+        also picks up entries written by other objects or processes.
+        """
+        with self._lock:
+            stats = self._stats()
+            self._size = sum(size for _, size, _ in stats)
+            for _, size, path in sorted(stats):
+                if self._size <= self.max_size:
+                    break
+                try:
+                    os.remove(path)
+                except OSError:
+                    continue
+                self._size -= size
@@ -23,3 +23,14 @@ types = [
     "default", "value", "delta", "smart", "histogram_bucket", "dimension_as_integer"
 ]
 order_type = _default_namedtuple("OrderType", types, tuple(s.upper() for s in types))
+
+# Maximum number of reportRequests accepted by a single batchGet call.
+MAX_REPORT_REQUESTS = 5
+
+# Maximum numbers of metrics and dimensions in a single reportRequest.
+MAX_METRICS = 10
+MAX_DIMENSIONS = 7
+
+# Default request limits: concurrent requests per view, and requests per second.
+MAX_CONCURRENT_REQUESTS = 10
+MAX_QPS = 10
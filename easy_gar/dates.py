@@ -0,0 +1,103 @@
+"""Google Analytics Reporting API v4 date helpers."""
+
+import datetime
+import re
+
+DATE_FORMAT = "%Y-%m-%d"
+
+# Format of ga:date dimension values in responses.
+REPORT_DATE_FORMAT = "%Y%m%d"
+
+_DAYS_AGO = re.compile(r"^(\d+)daysAgo$")
+
+
+def resolve_date(value, today=None):
+    """Return a datetime.date for an API date string.
+
+    Relative dates such as ``"today"``, ``"yesterday"`` and ``"7daysAgo"`` are
+    resolved against ``today``, which defaults to the local date.
+    """
+    if isinstance(value, datetime.date):
+        return value
+
+    today = today or datetime.date.today()
+    if value == "today":
+        return today
+    if value == "yesterday":
+        return today - datetime.timedelta(days=1)
+
+    match = _DAYS_AGO.match(value)
+    if match:
+        return today - datetime.timedelta(days=int(match.group(1)))
+
+    return datetime.datetime.strptime(value, DATE_FORMAT).date()
+
+
+def _next_shard_start(date, shard_by):
+    """Return the first date of the shard following the one containing date."""
+    if shard_by == "day":
+        return date + datetime.timedelta(days=1)
+    if shard_by == "week":
+        # Google Analytics weeks start on Sunday.
+        return date + datetime.timedelta(days=7 - (date.weekday() + 1) % 7)
+    if shard_by == "month":
+        if date.month == 12:
+            return datetime.date(date.year + 1, 1, 1)
+        return datetime.date(date.year, date.month + 1, 1)
+
+    msg = "Invalid shard_by; must be one of 'day', 'week' or 'month'"
+    raise ValueError(msg)
+
+
+def split_date_range(start_date, end_date, shard_by, today=None):
+    """Return a list of (start, end) date strings covering a date range.
+
+    The range is split on calendar day, week or month boundaries, as given by
+    ``shard_by``. The first and last shards may be partial.
+    """
+    start = resolve_date(start_date, today)
+    end = resolve_date(end_date, today)
+    if start > end:
+        raise ValueError("start_date must not be after end_date")
+
+    shards = []
+    while start <= end:
+        next_start = _next_shard_start(start, shard_by)
+        shard_end = min(next_start - datetime.timedelta(days=1), end)
+        shards.append((start.strftime(DATE_FORMAT), shard_end.strftime(DATE_FORMAT)))
+        start = next_start
+    return shards
+
+
+def contiguous_ranges(dates):
+    """Return a list of (start, end) date strings for runs of consecutive dates."""
+    ranges = []
+    for date in sorted(dates):
+        if ranges and date - ranges[-1][1] == datetime.timedelta(days=1):
+            ranges[-1][1] = date
+        else:
+            ranges.append([date, date])
+    return [
+        (start.strftime(DATE_FORMAT), end.strftime(DATE_FORMAT))
+        for start, end in ranges
+    ]
+
+
+def bisect_date_range(start_date, end_date, today=None):
+    """Return two (start, end) date strings splitting a date range in half.
+
+    Returns None if the range is a single day, which can't be split.
+    """
+    start = resolve_date(start_date, today)
+    end = resolve_date(end_date, today)
+    if start >= end:
+        return None
+
+    middle = start + (end - start) // 2
+    return [
+        (start.strftime(DATE_FORMAT), middle.strftime(DATE_FORMAT)),
+        (
+            (middle + datetime.timedelta(days=1)).strftime(DATE_FORMAT),
+            end.strftime(DATE_FORMAT),
+        ),
+    ]
@@ -1,15 +1,25 @@
 """Google Analytics Reporting API v4 Dimensions."""
 
-from easy_gar.base import Dimension
+from easy_gar.fields import Catalog, Dimension
 
 
 class ReportingDimension(Dimension):
     """Analytics Dimension class."""
 
-    def __init__(self, name, alias="", histogram_buckets=None):
-        """Init Dimension object."""
+    __slots__ = ("histogram_buckets", "time_format", "time_freq")
+
+    def __init__(
+        self, name, alias="", histogram_buckets=None, time_format=None, time_freq=None
+    ):
+        """Init Dimension object.
+
+        Time dimensions declare the ``time_format`` of their values, and
+        optionally a ``time_freq`` to parse them as periods of that frequency.
+        """
         super().__init__(name, alias)
         self.histogram_buckets = ([histogram_buckets] if histogram_buckets else [])
+        self.time_format = time_format
+        self.time_freq = time_freq
 
     def __repr__(self):
         """Repr string for class."""
@@ -22,539 +32,185 @@ class ReportingDimension(Dimension):
         return {"name": self.name, "histogramBuckets": self.histogram_buckets}
 
 
-class Dimensions:
-    """Analytics dimensions for use with the API objects."""
-
+# (attribute name, name, alias)
+_DIMENSIONS = [
     # Users
-    @property
-    def user_type(self):
-        return ReportingDimension(name="ga:userType", alias="User Type")
-
-    @property
-    def session_count(self):
-        return ReportingDimension(name="ga:sessionCount", alias="Count of Sessions")
-
-    @property
-    def days_since_last_session(self):
-        return ReportingDimension(
-            name="ga:daysSinceLastSession", alias="Days Since Last Session"
-        )
-
-    @property
-    def user_defined_value(self):
-        return ReportingDimension(
-            name="ga:userDefinedValue", alias="User Defined Value"
-        )
-
-    @property
-    def user_bucket(self):
-        return ReportingDimension(name="ga:userBucket", alias="User Bucket")
+    ("user_type", "ga:userType", "User Type"),
+    ("session_count", "ga:sessionCount", "Count of Sessions"),
+    ("days_since_last_session", "ga:daysSinceLastSession", "Days Since Last Session"),
+    ("user_defined_value", "ga:userDefinedValue", "User Defined Value"),
+    ("user_bucket", "ga:userBucket", "User Bucket"),
 
     # Sessions
-    @property
-    def session_duration_bucket(self):
-        return ReportingDimension(
-            name="ga:sessionDurationBucket", alias="Session Duration"
-        )
+    ("session_duration_bucket", "ga:sessionDurationBucket", "Session Duration"),
 
     # Traffic Sources
-    @property
-    def referral_path(self):
-        return ReportingDimension(name="ga:referralPath", alias="Referral Path")
-
-    @property
-    def full_referrer(self):
-        return ReportingDimension(name="ga:fullReferrer", alias="Full Referrer")
-
-    @property
-    def campaign(self):
-        return ReportingDimension(name="ga:campaign", alias="Campaign")
-
-    @property
-    def source(self):
-        return ReportingDimension(name="ga:source", alias="Source")
-
-    @property
-    def medium(self):
-        return ReportingDimension(name="ga:medium", alias="Medium")
-
-    @property
-    def source_medium(self):
-        return ReportingDimension(name="ga:sourceMedium", alias="Source / Medium")
-
-    @property
-    def keyword(self):
-        return ReportingDimension(name="ga:keyword", alias="Keyword")
-
-    @property
-    def ad_content(self):
-        return ReportingDimension(name="ga:adContent", alias="Ad Content")
-
-    @property
-    def social_network(self):
-        return ReportingDimension(name="ga:socialNetwork", alias="Social Network")
-
-    @property
-    def has_social_source_referral(self):
-        return ReportingDimension(
-            name="ga:hasSocialSourceReferral", alias="Social Source Referral"
-        )
-
-    @property
-    def campaign_code(self):
-        return ReportingDimension(name="ga:campaignCode", alias="Campaign Code")
+    ("referral_path", "ga:referralPath", "Referral Path"),
+    ("full_referrer", "ga:fullReferrer", "Full Referrer"),
+    ("campaign", "ga:campaign", "Campaign"),
+    ("source", "ga:source", "Source"),
+    ("medium", "ga:medium", "Medium"),
+    ("source_medium", "ga:sourceMedium", "Source / Medium"),
+    ("keyword", "ga:keyword", "Keyword"),
+    ("ad_content", "ga:adContent", "Ad Content"),
+    ("social_network", "ga:socialNetwork", "Social Network"),
+    (
+        "has_social_source_referral",
+        "ga:hasSocialSourceReferral",
+        "Social Source Referral",
+    ),
+    ("campaign_code", "ga:campaignCode", "Campaign Code"),
 
     # AdWords
-    @property
-    def ad_group(self):
-        return ReportingDimension(name="ga:adGroup", alias="AdWords Ad Group")
-
-    @property
-    def ad_slot(self):
-        return ReportingDimension(name="ga:adSlot", alias="AdWord Ad Slot")
-
-    @property
-    def ad_distribution_network(self):
-        return ReportingDimension(
-            name="ga:adDistributionNetwork", alias="Ad Distribution Network"
-        )
-
-    @property
-    def ad_match_type(self):
-        return ReportingDimension(name="ga:adMatchType", alias="Query Match Type")
-
-    @property
-    def ad_keyword_match_type(self):
-        return ReportingDimension(
-            name="ga:adKeywordMatchType", alias="Keyword Match Type"
-        )
-
-    @property
-    def ad_matched_query(self):
-        return ReportingDimension(name="ga:adMatchedQuery", alias="Search Query")
-
-    @property
-    def ad_placement_domain(self):
-        return ReportingDimension(name="ga:adPlacementDomain", alias="Placement Domain")
-
-    @property
-    def ad_placement_url(self):
-        return ReportingDimension(name="ga:adPlacementUrl", alias="Placement URL")
-
-    @property
-    def ad_format(self):
-        return ReportingDimension(name="ga:adFormat", alias="Ad Format")
-
-    @property
-    def ad_targeting_type(self):
-        return ReportingDimension(name="ga:adTargetingType", alias="Targeting Type")
-
-    @property
-    def ad_targeting_option(self):
-        return ReportingDimension(name="ga:adTargetingOption", alias="Placement Type")
-
-    @property
-    def ad_display_url(self):
-        return ReportingDimension(name="ga:adDisplayUrl", alias="Display URL")
-
-    @property
-    def ad_destination_url(self):
-        return ReportingDimension(name="ga:adDestinationUrl", alias="Destination URL")
-
-    @property
-    def adwords_customer_id(self):
-        return ReportingDimension(
-            name="ga:adwordsCustomerID", alias="AdWords Customer ID"
-        )
-
-    @property
-    def adwords_campaign_id(self):
-        return ReportingDimension(
-            name="ga:adwordsCampaignID", alias="AdWords Campaign ID"
-        )
-
-    @property
-    def adwords_ad_group_id(self):
-        return ReportingDimension(
-            name="ga:adwordsAdGroupID", alias="AdWords Ad Group ID"
-        )
-
-    @property
-    def adwords_creative_id(self):
-        return ReportingDimension(
-            name="ga:adwordsCreativeID", alias="AdWords Creative ID"
-        )
-
-    @property
-    def adwords_criterial_id(self):
-        return ReportingDimension(
-            name="ga:adwordsCriterialsID", alias="AdWord Criteria ID"
-        )
-
-    @property
-    def ad_query_word_count(self):
-        return ReportingDimension(name="ga:adQueryWordCount", alias="Query Word Count")
-
-    @property
-    def is_true_video_view_ad(self):
-        return ReportingDimension(
-            name="ga:isTrueViewVideoAd", alias="TrueView Video Ad"
-        )
+    ("ad_group", "ga:adGroup", "AdWords Ad Group"),
+    ("ad_slot", "ga:adSlot", "AdWord Ad Slot"),
+    ("ad_distribution_network", "ga:adDistributionNetwork", "Ad Distribution Network"),
+    ("ad_match_type", "ga:adMatchType", "Query Match Type"),
+    ("ad_keyword_match_type", "ga:adKeywordMatchType", "Keyword Match Type"),
+    ("ad_matched_query", "ga:adMatchedQuery", "Search Query"),
+    ("ad_placement_domain", "ga:adPlacementDomain", "Placement Domain"),
+    ("ad_placement_url", "ga:adPlacementUrl", "Placement URL"),
+    ("ad_format", "ga:adFormat", "Ad Format"),
+    ("ad_targeting_type", "ga:adTargetingType", "Targeting Type"),
+    ("ad_targeting_option", "ga:adTargetingOption", "Placement Type"),
+    ("ad_display_url", "ga:adDisplayUrl", "Display URL"),
+    ("ad_destination_url", "ga:adDestinationUrl", "Destination URL"),
+    ("adwords_customer_id", "ga:adwordsCustomerID", "AdWords Customer ID"),
+    ("adwords_campaign_id", "ga:adwordsCampaignID", "AdWords Campaign ID"),
+    ("adwords_ad_group_id", "ga:adwordsAdGroupID", "AdWords Ad Group ID"),
+    ("adwords_creative_id", "ga:adwordsCreativeID", "AdWords Creative ID"),
+    ("adwords_criterial_id", "ga:adwordsCriterialsID", "AdWord Criteria ID"),
+    ("ad_query_word_count", "ga:adQueryWordCount", "Query Word Count"),
+    ("is_true_video_view_ad", "ga:isTrueViewVideoAd", "TrueView Video Ad"),
 
     # Goal Conversions
-    @property
-    def goal_completion_location(self):
-        return ReportingDimension(
-            name="ga:goalCompletionLocation", alias="Goal Completion Location"
-        )
-
-    @property
-    def goal_previous_step1(self):
-        return ReportingDimension(
-            name="ga:goalPreviousStep1", alias="Goal Previous Step - 1"
-        )
-
-    @property
-    def goal_previous_step2(self):
-        return ReportingDimension(
-            name="ga:goalPreviousStep2", alias="Goal Previous Step - 2"
-        )
-
-    @property
-    def goal_previous_step3(self):
-        return ReportingDimension(
-            name="ga:goalPreviousStep3", alias="Goal Previous Step - 3"
-        )
+    (
+        "goal_completion_location",
+        "ga:goalCompletionLocation",
+        "Goal Completion Location",
+    ),
+    ("goal_previous_step1", "ga:goalPreviousStep1", "Goal Previous Step - 1"),
+    ("goal_previous_step2", "ga:goalPreviousStep2", "Goal Previous Step - 2"),
+    ("goal_previous_step3", "ga:goalPreviousStep3", "Goal Previous Step - 3"),
 
     # Platform or Device
-    @property
-    def browser(self):
-        return ReportingDimension(name="ga:browser", alias="Browser")
-
-    @property
-    def browser_version(self):
-        return ReportingDimension(name="ga:browserVersion", alias="Browser Version")
-
-    @property
-    def os(self):
-        return ReportingDimension(name="ga:operatingSystem", alias="Operating System")
-
-    @property
-    def os_version(self):
-        return ReportingDimension(
-            name="ga:operatingSystemVersion", alias="Operating System"
-        )
-
-    @property
-    def mobile_branding(self):
-        return ReportingDimension(
-            name="ga:mobileDeviceBranding", alias="Mobile Device Branding"
-        )
-
-    @property
-    def mobile_model(self):
-        return ReportingDimension(
-            name="ga:mobileDeviceModel", alias="Mobile Device Model"
-        )
-
-    @property
-    def mobile_input_selector(self):
-        return ReportingDimension(
-            name="ga:mobileInputSelector", alias="Mobile Input Selector"
-        )
-
-    @property
-    def mobile_device_info(self):
-        return ReportingDimension(
-            name="ga:mobileDeviceInfo", alias="Mobile Device Info"
-        )
-
-    @property
-    def mobile_marketing_name(self):
-        return ReportingDimension(
-            name="ga:mobileDeviceMarketingName", alias="Mobile Device Marketing Name"
-        )
-
-    @property
-    def device_category(self):
-        return ReportingDimension(name="ga:deviceCategory", alias="Device Category")
-
-    @property
-    def browser_size(self):
-        return ReportingDimension(name="ga:browserSize", alias="Browser Size")
-
-    @property
-    def data_source(self):
-        return ReportingDimension(name="ga:dataSource", alias="Data Source")
+    ("browser", "ga:browser", "Browser"),
+    ("browser_version", "ga:browserVersion", "Browser Version"),
+    ("os", "ga:operatingSystem", "Operating System"),
+    ("os_version", "ga:operatingSystemVersion", "Operating System"),
+    ("mobile_branding", "ga:mobileDeviceBranding", "Mobile Device Branding"),
+    ("mobile_model", "ga:mobileDeviceModel", "Mobile Device Model"),
+    ("mobile_input_selector", "ga:mobileInputSelector", "Mobile Input Selector"),
+    ("mobile_device_info", "ga:mobileDeviceInfo", "Mobile Device Info"),
+    (
+        "mobile_marketing_name",
+        "ga:mobileDeviceMarketingName",
+        "Mobile Device Marketing Name",
+    ),
+    ("device_category", "ga:deviceCategory", "Device Category"),
+    ("browser_size", "ga:browserSize", "Browser Size"),
+    ("data_source", "ga:dataSource", "Data Source"),
 
     # Geo Network
-    @property
-    def continent(self):
-        return ReportingDimension(name="ga:continent", alias="Continent")
-
-    @property
-    def subcontinent(self):
-        return ReportingDimension(name="ga:subContinent", alias="Sub Continent")
-
-    @property
-    def country(self):
-        return ReportingDimension(name="ga:country", alias="Country")
-
-    @property
-    def region(self):
-        return ReportingDimension(name="ga:region", alias="Region")
-
-    @property
-    def metro(self):
-        return ReportingDimension(name="ga:metro", alias="Metro")
-
-    @property
-    def city(self):
-        return ReportingDimension(name="ga:city", alias="City")
-
-    @property
-    def latitude(self):
-        return ReportingDimension(name="ga:latitude", alias="Latitude")
-
-    @property
-    def longitude(self):
-        return ReportingDimension(name="ga:longitude", alias="Longitude")
-
-    @property
-    def network_domain(self):
-        return ReportingDimension(name="ga:networkDomain", alias="Network Domain")
-
-    @property
-    def network_location(self):
-        return ReportingDimension(name="ga:networkLocation", alias="Service Provider")
-
-    @property
-    def city_id(self):
-        return ReportingDimension(name="ga:cityId", alias="City ID")
-
-    @property
-    def continent_id(self):
-        return ReportingDimension(name="ga:continentId", alias="Continent ID")
-
-    @property
-    def country_iso_code(self):
-        return ReportingDimension(name="ga:countryIsoCode", alias="Country ISO Code")
-
-    @property
-    def metro_id(self):
-        return ReportingDimension(name="ga:metroId", alias="Metro ID")
-
-    @property
-    def region_id(self):
-        return ReportingDimension(name="ga:regionId", alias="Region ID")
-
-    @property
-    def region_iso_code(self):
-        return ReportingDimension(name="ga:regionIsoCode", alias="Region ISO Code")
-
-    @property
-    def subcontinent_code(self):
-        return ReportingDimension(
-            name="ga:subContenentCode", alias="Sub Continent Code"
-        )
+    ("continent", "ga:continent", "Continent"),
+    ("subcontinent", "ga:subContinent", "Sub Continent"),
+    ("country", "ga:country", "Country"),
+    ("region", "ga:region", "Region"),
+    ("metro", "ga:metro", "Metro"),
+    ("city", "ga:city", "City"),
+    ("latitude", "ga:latitude", "Latitude"),
+    ("longitude", "ga:longitude", "Longitude"),
+    ("network_domain", "ga:networkDomain", "Network Domain"),
+    ("network_location", "ga:networkLocation", "Service Provider"),
+    ("city_id", "ga:cityId", "City ID"),
+    ("continent_id", "ga:continentId", "Continent ID"),
+    ("country_iso_code", "ga:countryIsoCode", "Country ISO Code"),
+    ("metro_id", "ga:metroId", "Metro ID"),
+    ("region_id", "ga:regionId", "Region ID"),
+    ("region_iso_code", "ga:regionIsoCode", "Region ISO Code"),
+    ("subcontinent_code", "ga:subContenentCode", "Sub Continent Code"),
 
     # System
-    @property
-    def flash_version(self):
-        return ReportingDimension(name="ga:flashVersion", alias="Flash Version")
-
-    @property
-    def java_enabled(self):
-        return ReportingDimension(name="ga:javaEnabled", alias="Java Support")
-
-    @property
-    def language(self):
-        return ReportingDimension(name="ga:language", alias="Language")
-
-    @property
-    def screen_colors(self):
-        return ReportingDimension(name="ga:screenColors", alias="Screen Colors")
-
-    @property
-    def source_property_display_name(self):
-        return ReportingDimension(
-            name="ga:sourcePropertyDisplayName", alias="Source Property Display Name"
-        )
-
-    @property
-    def source_property_tracking_id(self):
-        return ReportingDimension(
-            name="ga:sourcePropertyTrackingId", alias="Source Property Tracking ID"
-        )
-
-    @property
-    def screen_resolution(self):
-        return ReportingDimension(name="ga:screenResolution", alias="Screen Resolution")
+    ("flash_version", "ga:flashVersion", "Flash Version"),
+    ("java_enabled", "ga:javaEnabled", "Java Support"),
+    ("language", "ga:language", "Language"),
+    ("screen_colors", "ga:screenColors", "Screen Colors"),
+    (
+        "source_property_display_name",
+        "ga:sourcePropertyDisplayName",
+        "Source Property Display Name",
+    ),
+    (
+        "source_property_tracking_id",
+        "ga:sourcePropertyTrackingId",
+        "Source Property Tracking ID",
+    ),
+    ("screen_resolution", "ga:screenResolution", "Screen Resolution"),
 
     # Page Tracking
-    @property
-    def hostname(self):
-        return ReportingDimension(name="ga:hostname", alias="Hostname")
-
-    @property
-    def page_path(self):
-        return ReportingDimension(name="ga:pagePath", alias="Page")
-
-    @property
-    def page_path_level1(self):
-        return ReportingDimension(name="ga:pagePathLevel1", alias="Page path level 1")
-
-    @property
-    def page_path_level2(self):
-        return ReportingDimension(name="ga:pagePathLevel2", alias="Page path level 2")
-
-    @property
-    def page_path_level3(self):
-        return ReportingDimension(name="ga:pagePathLevel3", alias="Page path level 3")
-
-    @property
-    def page_path_level4(self):
-        return ReportingDimension(name="ga:pagePathLevel4", alias="Page path level 4")
-
-    @property
-    def page_title(self):
-        return ReportingDimension(name="ga:pageTitle", alias="Page Title")
-
-    @property
-    def landing_page_path(self):
-        return ReportingDimension(name="ga:landingPagePath", alias="Landing Page")
-
-    @property
-    def second_page_path(self):
-        return ReportingDimension(name="ga:secondPagePath", alias="Second Page")
-
-    @property
-    def exit_page_path(self):
-        return ReportingDimension(name="ga:exitPagePath", alias="Exit Page")
-
-    @property
-    def previous_page_path(self):
-        return ReportingDimension(
-            name="ga:previousPagePath", alias="Previous Page Path"
-        )
-
-    @property
-    def page_depth(self):
-        return ReportingDimension(name="ga:pageDepth", alias="Page Depth")
+    ("hostname", "ga:hostname", "Hostname"),
+    ("page_path", "ga:pagePath", "Page"),
+    ("page_path_level1", "ga:pagePathLevel1", "Page path level 1"),
+    ("page_path_level2", "ga:pagePathLevel2", "Page path level 2"),
+    ("page_path_level3", "ga:pagePathLevel3", "Page path level 3"),
+    ("page_path_level4", "ga:pagePathLevel4", "Page path level 4"),
+    ("page_title", "ga:pageTitle", "Page Title"),
+    ("landing_page_path", "ga:landingPagePath", "Landing Page"),
+    ("second_page_path", "ga:secondPagePath", "Second Page"),
+    ("exit_page_path", "ga:exitPagePath", "Exit Page"),
+    ("previous_page_path", "ga:previousPagePath", "Previous Page Path"),
+    ("page_depth", "ga:pageDepth", "Page Depth"),
 
     # Time
-    @property
-    def date(self):
-        return ReportingDimension(name="ga:date", alias="Date")
-
-    @property
-    def year(self):
-        return ReportingDimension(name="ga:year", alias="Year")
-
-    @property
-    def month(self):
-        return ReportingDimension(name="ga:month", alias="Month of the Year")
-
-    @property
-    def week(self):
-        return ReportingDimension(name="ga:week", alias="Week of the Year")
-
-    @property
-    def day(self):
-        return ReportingDimension(name="ga:day", alias="Day of the Month")
-
-    @property
-    def hour(self):
-        return ReportingDimension(name="ga:hour", alias="Hour")
-
-    @property
-    def minute(self):
-        return ReportingDimension(name="ga:minute", alias="Minute")
-
-    @property
-    def nth_month(self):
-        return ReportingDimension(name="ga:nthMonth", alias="Month Index")
-
-    @property
-    def nth_week(self):
-        return ReportingDimension(name="ga:nthWeek", alias="Week Index")
-
-    @property
-    def nth_day(self):
-        return ReportingDimension(name="ga:nthDay", alias="Day Index")
-
-    @property
-    def nth_minute(self):
-        return ReportingDimension(name="ga:nthMinute", alias="Minute Index")
-
-    @property
-    def day_of_week(self):
-        return ReportingDimension(name="ga:dayOfWeek", alias="Day of Week")
-
-    @property
-    def day_of_week_name(self):
-        return ReportingDimension(name="ga:dayOfWeekName", alias="Day of Week Name")
-
-    @property
-    def date_hour(self):
-        return ReportingDimension(name="ga:dateHour", alias="Hour of Day")
-
-    @property
-    def date_hour_minute(self):
-        return ReportingDimension(name="ga:dateHourMinute", alias="Dat Hour and Minute")
-
-    @property
-    def year_month(self):
-        return ReportingDimension(name="ga:yearMonth", alias="Month of Year")
-
-    @property
-    def year_week(self):
-        return ReportingDimension(name="ga:yearWeek", alias="Week of Year")
-
-    @property
-    def iso_week(self):
-        return ReportingDimension(name="ga:isoWeek", alias="ISO Week of the Year")
-
-    @property
-    def iso_year(self):
-        return ReportingDimension(name="ga:isoYear", alias="ISO Year")
-
-    @property
-    def iso_year_iso_week(self):
-        return ReportingDimension(
-            name="ga:isoYearIsoWeek", alias="ISO Week of ISO Year"
-        )
-
-    @property
-    def nth_hour(self):
-        return ReportingDimension(name="ga:nthHour", alias="Hour Index")
+    ("date", "ga:date", "Date"),
+    ("year", "ga:year", "Year"),
+    ("month", "ga:month", "Month of the Year"),
+    ("week", "ga:week", "Week of the Year"),
+    ("day", "ga:day", "Day of the Month"),
+    ("hour", "ga:hour", "Hour"),
+    ("minute", "ga:minute", "Minute"),
+    ("nth_month", "ga:nthMonth", "Month Index"),
+    ("nth_week", "ga:nthWeek", "Week Index"),
+    ("nth_day", "ga:nthDay", "Day Index"),
+    ("nth_minute", "ga:nthMinute", "Minute Index"),
+    ("day_of_week", "ga:dayOfWeek", "Day of Week"),
+    ("day_of_week_name", "ga:dayOfWeekName", "Day of Week Name"),
+    ("date_hour", "ga:dateHour", "Hour of Day"),
+    ("date_hour_minute", "ga:dateHourMinute", "Dat Hour and Minute"),
+    ("year_month", "ga:yearMonth", "Month of Year"),
+    ("year_week", "ga:yearWeek", "Week of Year"),
+    ("iso_week", "ga:isoWeek", "ISO Week of the Year"),
+    ("iso_year", "ga:isoYear", "ISO Year"),
+    ("iso_year_iso_week", "ga:isoYearIsoWeek", "ISO Week of ISO Year"),
+    ("nth_hour", "ga:nthHour", "Hour Index"),
 
     # Audience
-    @property
-    def user_age_bracket(self):
-        return ReportingDimension(name="ga:userAgeBracket", alias="Age")
-
-    @property
-    def user_gender(self):
-        return ReportingDimension(name="ga:userGender", alias="Gender")
-
-    @property
-    def interest_other_category(self):
-        return ReportingDimension(
-            name="ga:interestOtherCategory", alias="Other Category"
-        )
-
-    @property
-    def interest_affinity_category(self):
-        return ReportingDimension(
-            name="ga:interestAffinityCategory", alias="Affinity Category (reach)"
-        )
-
-    @property
-    def interest_in_market_category(self):
-        return ReportingDimension(
-            name="ga:interestInMarketCategory", alias="In-Market Segment"
-        )
+    ("user_age_bracket", "ga:userAgeBracket", "Age"),
+    ("user_gender", "ga:userGender", "Gender"),
+    ("interest_other_category", "ga:interestOtherCategory", "Other Category"),
+    (
+        "interest_affinity_category",
+        "ga:interestAffinityCategory",
+        "Affinity Category (reach)",
+    ),
+    ("interest_in_market_category", "ga:interestInMarketCategory", "In-Market Segment"),
+]
+
+# Time dimensions: name -> (time format, time frequency)
+_TIME_FORMATS = {
+    "ga:date": ("%Y%m%d", None),
+    "ga:dateHour": ("%Y%m%d%H", None),
+    "ga:dateHourMinute": ("%Y%m%d%H%M", None),
+    "ga:yearMonth": ("%Y%m", "M"),
+    "ga:isoYearIsoWeek": ("%G%V%u", "W-SUN"),
+}
+
+
+class Dimensions(Catalog):
+    """Analytics dimensions for use with the API objects."""
 
 
-dimensions = Dimensions()
+dimensions = Dimensions(
+    (attr, ReportingDimension(name, alias, None, *_TIME_FORMATS.get(name, ())))
+    for attr, name, alias in _DIMENSIONS
+)
@@ -0,0 +1,125 @@
+"""Request field classes."""
+
+
+class _Freezable:
+    """Mixin for objects that can be made read-only."""
+
+    __slots__ = ("_frozen",)
+
+    def __setattr__(self, name, value):
+        """Set attribute, unless the object is frozen."""
+        if getattr(self, "_frozen", False):
+            msg = f"{self!r} is shared and read-only; create a new object instead"
+            raise AttributeError(msg)
+        super().__setattr__(name, value)
+
+    def _freeze(self):
+        object.__setattr__(self, "_frozen", True)
+
+
+class Metric(_Freezable):
+    """Base Metric class."""
+
+    __slots__ = ("expression", "alias", "formatting_type")
+
+    def __init__(self, expression=None, alias=None, formatting_type=None):
+        """Init Metric object."""
+        self.expression = expression
+        self.alias = alias
+        self.formatting_type = formatting_type
+
+    def __repr__(self, alias=None, formatting_type=None):
+        """Repr string for class."""
+        return (
+            f"{self.__class__.__name__}('{self.expression}', "
+            f"'{self.alias}', '{self.formatting_type}')"
+        )
+
+    def __str__(self):
+        """String representation of metric name."""
+        return f"{self.expression}"
+
+    def __call__(self):
+        raise NotImplementedError
+
+
+class Dimension(_Freezable):
+    """Base Dimension class."""
+
+    __slots__ = ("name", "alias")
+
+    def __init__(self, name, alias=""):
+        """Init Dimension object."""
+        self.name = name
+        self.alias = alias
+
+    def __repr__(self):
+        """Repr string for Dimension object."""
+        return f"{self.__class__.__name__}(name='{self.name}', alias='{self.alias}')"
+
+    def __str__(self):
+        """String representation of Dimension object."""
+        return f"{self.name}"
+
+    def __call__(self):
+        """Return dictionary to be used in API requests."""
+        return {"name": self.name}
+
+
+class OrderBy:
+    """Reporting API orderBy object."""
+
+    def __init__(self, field_name, order_type="VALUE", sort_order="ASCENDING"):
+        """Init OrderBy object."""
+        self.field_name = field_name
+        self.order_type = order_type
+        self.sort_order = sort_order
+
+    def __call__(self):
+        return {
+            "fieldName": str(self.field_name),
+            "orderType": self.order_type,
+            "sortOrder": self.sort_order,
+        }
+
+
+class Catalog:
+    """Registry of shared, read-only metrics or dimensions.
+
+    Fields are available as attributes, and can be looked up with ``[]`` or
+    ``get()`` by attribute name, API name (such as ``"ga:users"``) or alias.
+    """
+
+    def __init__(self, fields):
+        """Init Catalog object from (attribute name, field) pairs."""
+        self._lookup = {}
+        self._fields = []
+        for attr, field in fields:
+            field._freeze()
+            setattr(self, attr, field)
+            self._fields.append(field)
+            for key in (attr, str(field), field.alias):
+                self._lookup.setdefault(key, field)
+
+    def __getitem__(self, key):
+        """Return the field with the given attribute name, API name or alias."""
+        try:
+            return self._lookup[key]
+        except KeyError:
+            raise KeyError(f"unknown field {key!r}") from None
+
+    def get(self, key, default=None):
+        """Return the field for key, or default."""
+        return self._lookup.get(key, default)
+
+    def __contains__(self, key):
+        """Return whether key is an attribute name, API name or alias."""
+        return key in self._lookup
+
+    def __iter__(self):
+        """Iterate over fields."""
+        return iter(self._fields)
+
+    def __len__(self):
+        """Return the number of fields."""
+        return len(self._fields)
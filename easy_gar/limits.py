@@ -0,0 +1,192 @@
+"""Request limiters for Google Analytics Reporting API v4.
+
+A limiter is any object with an ``acquire(view_id)`` method returning a
+context manager, which is held for the duration of a batchGet call. The
+asyncio client uses ``acquire_async(view_id)`` instead, which returns an async
+context manager.
+"""
+
+import asyncio
+from collections import namedtuple
+import contextlib
+import os
+import struct
+import threading
+import time
+
+from easy_gar.constants import MAX_CONCURRENT_REQUESTS, MAX_QPS
+
+LimiterStats = namedtuple("LimiterStats", "requests slot_wait rate_wait max_wait")
+LimiterStats.__doc__ = """Wait times, in seconds, of the requests for one view.
+
+``slot_wait`` is the total time spent waiting for a concurrent request slot,
+``rate_wait`` the total time spent waiting on the QPS limit and ``max_wait``
+the longest combined wait of any single request.
+"""
+
+# Tokens left and time of last refill, as stored in a shared bucket file.
+_BUCKET = struct.Struct("dd")
+
+
+@contextlib.contextmanager
+def _file_lock(path, blocking=True):
+    """Hold an exclusive lock on a file, yielding None if it is taken."""
+    import fcntl
+
+    fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        flags = fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB
+        try:
+            fcntl.flock(fd, flags)
+        except BlockingIOError:
+            yield None
+            return
+        try:
+            yield fd
+        finally:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+    finally:
+        os.close(fd)
+
+
+class RequestLimiter:
+    """Limit concurrent requests per view and requests per second.
+
+    At most ``max_concurrent`` requests for a view are in flight at once, and
+    requests start at no more than ``qps`` per second, with bursts of up to
+    ``burst`` requests. Share one limiter between the ``ReportingAPI``
+    instances of a Google Cloud project.
+
+    By default the limits hold across the threads of one process. Pass
+    ``lock_dir`` to also share them, through lock files in that directory,
+    with every process on the host that uses the same directory. Lock files
+    need a POSIX system.
+    """
+
+    def __init__(
+        self,
+        max_concurrent=MAX_CONCURRENT_REQUESTS,
+        qps=MAX_QPS,
+        burst=None,
+        lock_dir=None,
+        poll_interval=0.01,
+    ):
+        """Init RequestLimiter object."""
+        self.max_concurrent = max_concurrent
+        self.qps = qps
+        self.burst = burst or max(1, int(qps))
+        self.lock_dir = lock_dir
+        self.poll_interval = poll_interval
+        self._lock = threading.Lock()
+        self._semaphores = {}
+        self._tokens = float(self.burst)
+        self._refilled = time.time()
+        self._stats = {}
+        if lock_dir is not None:
+            os.makedirs(lock_dir, exist_ok=True)
+
+    def _semaphore(self, view_id):
+        with self._lock:
+            if view_id not in self._semaphores:
+                self._semaphores[view_id] = threading.BoundedSemaphore(
+                    self.max_concurrent
+                )
+            return self._semaphores[view_id]
+
+    @contextlib.contextmanager
+    def _slot(self, view_id):
+        """Hold one of the concurrent request slots for a view."""
+        with self._semaphore(view_id):
+            if self.lock_dir is None:
+                yield
+                return
+
+            # Each slot is a lock file, so the limit holds across processes.
+            while True:
+                for n in range(self.max_concurrent):
+                    path = os.path.join(self.lock_dir, f"view-{view_id}.{n}.lock")
+                    with _file_lock(path, blocking=False) as fd:
+                        if fd is not None:
+                            yield
+                            return
+                time.sleep(self.poll_interval)
+
+    def _refill(self, tokens, refilled, now):
+        """Return the tokens in the bucket at time now."""
+        return min(self.burst, tokens + (now - refilled) * self.qps)
+
+    def _take_token(self):
+        """Take a token from the bucket, returning 0 or seconds until one is due."""
+        now = time.time()
+        if self.lock_dir is None:
+            with self._lock:
+                tokens = self._refill(self._tokens, self._refilled, now)
+                self._tokens = tokens - 1 if tokens >= 1 else tokens
+                self._refilled = now
+        else:
+            # The bucket lives in a file, so that processes share it.
+            path = os.path.join(self.lock_dir, "qps.bucket")
+            with _file_lock(path) as fd:
+                data = os.pread(fd, _BUCKET.size, 0)
+                if len(data) == _BUCKET.size:
+                    tokens = self._refill(*_BUCKET.unpack(data), now)
+                else:
+                    tokens = float(self.burst)
+                remaining = tokens - 1 if tokens >= 1 else tokens
+                os.pwrite(fd, _BUCKET.pack(remaining, now), 0)
+
+        if tokens >= 1:
+            return 0
+        return (1 - tokens) / self.qps
+
+    def _wait_for_token(self):
+        """Block until a token can be taken from the bucket."""
+        while True:
+            wait = self._take_token()
+            if wait == 0:
+                return
+            time.sleep(wait)
+
+    @contextlib.contextmanager
+    def acquire(self, view_id):
+        """Hold a request slot for view_id, once the QPS limit allows it."""
+        start = time.monotonic()
+        with self._slot(view_id):
+            acquired = time.monotonic()
+            self._wait_for_token()
+            self._record(view_id, acquired - start, time.monotonic() - acquired)
+            yield
+
+    @contextlib.asynccontextmanager
+    async def acquire_async(self, view_id):
+        """Hold a request slot for view_id, without blocking the event loop.
+
+        Waiting is done on a thread of the event loop's default executor, so
+        asyncio and threaded clients share the same limits.
+        """
+        context = self.acquire(view_id)
+        loop = asyncio.get_event_loop()
+        await loop.run_in_executor(None, context.__enter__)
+        try:
+            yield
+        finally:
+            context.__exit__(None, None, None)
+
+    def _record(self, view_id, slot_wait, rate_wait):
+        with self._lock:
+            stats = self._stats.get(view_id, LimiterStats(0, 0.0, 0.0, 0.0))
+            self._stats[view_id] = LimiterStats(
+                stats.requests + 1,
+                stats.slot_wait + slot_wait,
+                stats.rate_wait + rate_wait,
+                max(stats.max_wait, slot_wait + rate_wait),
+            )
+
+    def stats(self):
+        """Return a dict of LimiterStats for the requests made, by view ID.
+
+        Statistics only cover requests made through this limiter, in this
+        process.
+        """
+        with self._lock:
+            return dict(self._stats)
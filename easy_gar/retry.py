@@ -0,0 +1,190 @@
+"""Retry policies for Google Analytics Reporting API v4 requests."""
+
+import asyncio
+import collections
+import contextlib
+import contextvars
+import email.utils
+import itertools
+import json
+import random
+import socket
+import threading
+import time
+
+from apiclient.errors import HttpError
+
+# Error reasons worth retrying, as given in API error responses.
+RETRY_REASONS = (
+    "userRateLimitExceeded",
+    "rateLimitExceeded",
+    "quotaExceeded",
+    "internalServerError",
+    "backendError",
+)
+
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# Transient network errors worth retrying. Other OSErrors, such as a missing
+# secrets file, are raised at once.
+RETRY_EXCEPTIONS = (socket.timeout, TimeoutError, ConnectionError, asyncio.TimeoutError)
+
+# Monotonic time by which the current get_report call must finish, if any.
+_deadline = contextvars.ContextVar("easy_gar_deadline", default=None)
+
+
+def _error_reason(content):
+    """Return the reason of the first error in an API error response."""
+    try:
+        error = json.loads(content)["error"]
+        return error["errors"][0]["reason"]
+    except (ValueError, KeyError, IndexError, TypeError):
+        return None
+
+
+def _retry_after(error):
+    """Return the seconds to wait given by a Retry-After header, or None."""
+    value = error.resp.get("retry-after") if isinstance(error, HttpError) else None
+    if value is None:
+        return None
+    if value.strip().isdigit():
+        return float(value)
+    try:
+        date = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, date.timestamp() - time.time())
+
+
+@contextlib.contextmanager
+def time_budget(seconds):
+    """Give the requests made within the block ``seconds`` to finish.
+
+    A budget set inside another only shortens it. If ``seconds`` is None,
+    the enclosing budget, if any, applies.
+    """
+    deadline = _deadline.get()
+    if seconds is not None:
+        end = time.monotonic() + seconds
+        deadline = end if deadline is None else min(deadline, end)
+    token = _deadline.set(deadline)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+class RetryPolicy:
+    """Decide whether, and when, to retry a failed request.
+
+    Failed requests are retried after a random delay of up to
+    ``base_delay * 2 ** n`` seconds, capped at ``max_delay``, for at most
+    ``max_attempts`` attempts in all. A delay asked for by a Retry-After
+    header is waited out in full. If ``deadline`` is set, a ``get_report``
+    call gives up once retrying would take it past ``deadline`` seconds.
+
+    API errors with one of ``retry_reasons``, responses with one of
+    ``retry_statuses`` and exceptions of ``retry_exceptions``, by default
+    timeouts and connection errors, are retried. Anything else is raised at once.
+    """
+
+    def __init__(
+        self,
+        max_attempts=5,
+        base_delay=1.0,
+        max_delay=32.0,
+        deadline=None,
+        retry_reasons=RETRY_REASONS,
+        retry_statuses=RETRY_STATUSES,
+        retry_exceptions=RETRY_EXCEPTIONS,
+    ):
+        """Init RetryPolicy object."""
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.deadline = deadline
+        self.retry_reasons = retry_reasons
+        self.retry_statuses = retry_statuses
+        self.retry_exceptions = retry_exceptions
+        self._counts = collections.Counter()
+        self._lock = threading.Lock()
+
+    def classify(self, error):
+        """Return the reason to retry after error, or None not to retry."""
+        if isinstance(error, HttpError):
+            reason = _error_reason(error.content)
+            if reason in self.retry_reasons:
+                return reason
+            status = int(error.resp.status)
+            if status in self.retry_statuses:
+                return f"http{status}"
+            return None
+        if isinstance(error, self.retry_exceptions):
+            return type(error).__name__
+        return None
+
+    def backoff(self, attempt):
+        """Return a random delay before retrying after the given attempt."""
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+
+    def next_delay(self, error, attempt):
+        """Return the seconds to wait before retrying, or None to give up.
+
+        ``attempt`` counts from zero for the first attempt.
+        """
+        reason = self.classify(error)
+        if reason is None or attempt + 1 >= self.max_attempts:
+            self._count("failures")
+            return None
+
+        delay = self.backoff(attempt)
+        retry_after = _retry_after(error)
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+
+        deadline = _deadline.get()
+        if deadline is not None and time.monotonic() + delay > deadline:
+            self._count("deadline_exceeded")
+            self._count("failures")
+            return None
+
+        self._count("retries")
+        self._count(reason)
+        return delay
+
+    def call(self, request):
+        """Return the result of calling request, retrying it on failure."""
+        for attempt in itertools.count():
+            self._count("attempts")
+            try:
+                return request()
+            except Exception as err:
+                delay = self.next_delay(err, attempt)
+                if delay is None:
+                    raise
+            time.sleep(delay)
+
+    async def call_async(self, request):
+        """Return the result of awaiting request(), retrying it on failure."""
+        for attempt in itertools.count():
+            self._count("attempts")
+            try:
+                return await request()
+            except Exception as err:
+                delay = self.next_delay(err, attempt)
+                if delay is None:
+                    raise
+            await asyncio.sleep(delay)
+
+    def _count(self, key):
+        with self._lock:
+            self._counts[key] += 1
+
+    def counts(self):
+        """Return a dict of counters of the requests made under this policy.
+
+        Counters are kept for ``attempts``, ``retries``, ``failures`` and
+        ``deadline_exceeded``, and for each reason a request was retried.
+        """
+        with self._lock:
+            return dict(self._counts)
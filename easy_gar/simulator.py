@@ -0,0 +1,459 @@
+"""Local simulator of the Google Analytics Reporting API v4 batchGet endpoint.
+
+The simulator answers ``reports:batchGet`` calls with synthetic rows for any
+combination of metrics and dimensions, paginated like the real API. Latency,
+error responses, sampling and the per-view limit on concurrent requests are
+all configurable, for load testing without spending quota.
+
+Run it in a background thread with ``Simulator``, or from the command line
+with ``python -m easy_gar.simulator``, and point a ``ReportingAPI`` at its
+``url`` with ``api_endpoint``.
+"""
+
+import argparse
+import datetime
+import http.server
+import json
+import random
+import threading
+import time
+import zlib
+
+from easy_gar.constants import MAX_DIMENSIONS, MAX_METRICS, MAX_REPORT_REQUESTS
+from easy_gar.dates import resolve_date
+from easy_gar.dimensions import dimensions as _dimensions
+from easy_gar.metrics import metrics as _metrics
+
+BATCH_GET_PATH = "/v4/reports:batchGet"
+
+# HTTP status and status name of each error reason the simulator can inject.
+ERROR_STATUSES = {
+    "userRateLimitExceeded": (429, "RESOURCE_EXHAUSTED"),
+    "rateLimitExceeded": (429, "RESOURCE_EXHAUSTED"),
+    "quotaExceeded": (429, "RESOURCE_EXHAUSTED"),
+    "internalServerError": (500, "INTERNAL"),
+    "backendError": (503, "UNAVAILABLE"),
+    "badRequest": (400, "INVALID_ARGUMENT"),
+}
+
+_MASK = 2 ** 64 - 1
+
+
+class SimulatorError(Exception):
+    """Error response to return for a batchGet call."""
+
+    def __init__(self, reason, message):
+        """Init SimulatorError object."""
+        super().__init__(message)
+        self.reason = reason
+
+
+def _mix(*values):
+    """Return a well-mixed 64-bit hash of some integers."""
+    x = 0x9E3779B97F4A7C15
+    for value in values:
+        x = ((x ^ value) * 0xBF58476D1CE4E5B9) & _MASK
+        x ^= x >> 31
+    return x
+
+
+def _digest(value):
+    """Return a stable 32-bit digest of a value's string."""
+    return zlib.crc32(str(value).encode("utf-8"))
+
+
+def _metric_value(formatting_type, x):
+    """Return a synthetic metric value string of a formatting type."""
+    if formatting_type in (None, "INTEGER", "METRIC_TYPE_UNSPECIFIED"):
+        return str(x % 1000)
+    if formatting_type == "PERCENT":
+        return f"{x % 10000 / 100:.2f}"
+    return f"{x % 100000 / 100:.2f}"
+
+
+def _time_value(name, day):
+    """Return the value of a time dimension on a day."""
+    dimension = _dimensions.get(name)
+    time_format = getattr(dimension, "time_format", None)
+    if time_format.endswith("%u"):
+        time_format = time_format[:-2]
+    return day.strftime(time_format)
+
+
+class Simulator:
+    """Simulated Google Analytics Reporting API v4 server.
+
+    Reports have up to ``rows_per_day`` rows for each day of the date range,
+    or for the whole range if there is no time dimension. Each dimension
+    without a time format has ``cardinality`` distinct values. Metric values
+    are deterministic for a given ``seed``, view and row, so a row has the
+    same values whichever date range it is requested in.
+
+    Each call is delayed by a log-normally distributed latency with a median
+    of ``latency`` seconds, and fails with probability ``errors[reason]``
+    for each error reason given. A call that would take a view over
+    ``max_concurrent`` requests in flight fails with userRateLimitExceeded.
+    Reports covering more than ``sampling_threshold`` rows are marked as
+    sampled.
+    """
+
+    def __init__(
+        self,
+        host="127.0.0.1",
+        port=0,
+        rows_per_day=100,
+        cardinality=100,
+        latency=0.0,
+        latency_sigma=0.5,
+        errors=None,
+        max_concurrent=10,
+        sampling_threshold=None,
+        retry_after=None,
+        seed=0,
+    ):
+        """Init Simulator object."""
+        self.host = host
+        self.port = port
+        self.rows_per_day = rows_per_day
+        self.cardinality = cardinality
+        self.latency = latency
+        self.latency_sigma = latency_sigma
+        self.errors = dict(errors or {})
+        self.max_concurrent = max_concurrent
+        self.sampling_threshold = sampling_threshold
+        self.retry_after = retry_after
+        self.seed = seed
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._in_flight = {}
+        self._stats = {"calls": 0, "reports": 0, "rows": 0, "errors": {}}
+        self._peaks = {}
+        self._server = None
+        self._thread = None
+
+    @property
+    def url(self):
+        """Return the base URL of the running simulator."""
+        return f"http://{self.host}:{self.port}/"
+
+    def start(self):
+        """Start serving in a background thread."""
+        self._server = http.server.ThreadingHTTPServer(
+            (self.host, self.port), _handler(self)
+        )
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever)
+        self._thread.daemon = True
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop serving."""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._thread.join()
+            self._server = None
+
+    def __enter__(self):
+        """Start serving on entering context."""
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        """Stop serving on exiting context."""
+        self.stop()
+
+    def stats(self):
+        """Return counters of the calls served.
+
+        Counters are kept of batchGet ``calls``, of the ``reports`` and
+        ``rows`` returned, of ``errors`` by reason and of the ``peak``
+        number of concurrent requests for each view.
+        """
+        with self._lock:
+            stats = dict(self._stats, errors=dict(self._stats["errors"]))
+            stats["peak"] = dict(self._peaks)
+            return stats
+
+    def batch_get(self, body):
+        """Return the status, headers and JSON payload for a batchGet body."""
+        requests = body.get("reportRequests") or []
+        view_id = requests[0].get("viewId") if requests else None
+        with self._lock:
+            self._stats["calls"] += 1
+            in_flight = self._in_flight.get(view_id, 0) + 1
+            self._in_flight[view_id] = in_flight
+            self._peaks[view_id] = max(self._peaks.get(view_id, 0), in_flight)
+            delay = self.latency * self._random.lognormvariate(0, self.latency_sigma)
+            failures = [
+                reason
+                for reason, rate in self.errors.items()
+                if self._random.random() < rate
+            ]
+
+        try:
+            if in_flight > self.max_concurrent:
+                raise SimulatorError(
+                    "userRateLimitExceeded", "Too many concurrent requests"
+                )
+            time.sleep(delay)
+            if failures:
+                raise SimulatorError(failures[0], f"Simulated {failures[0]}")
+            reports = self._reports(requests)
+        except SimulatorError as err:
+            return self._error(err)
+        finally:
+            with self._lock:
+                self._in_flight[view_id] -= 1
+
+        with self._lock:
+            self._stats["reports"] += len(reports)
+            self._stats["rows"] += sum(
+                len(report["data"].get("rows", ())) for report in reports
+            )
+        return 200, {}, {"reports": reports}
+
+    def _error(self, err):
+        """Return the status, headers and payload of an error response."""
+        status, status_name = ERROR_STATUSES[err.reason]
+        with self._lock:
+            errors = self._stats["errors"]
+            errors[err.reason] = errors.get(err.reason, 0) + 1
+
+        headers = {}
+        if status == 429 and self.retry_after is not None:
+            headers["Retry-After"] = str(self.retry_after)
+        payload = {
+            "error": {
+                "code": status,
+                "message": str(err),
+                "status": status_name,
+                "errors": [{"reason": err.reason, "message": str(err)}],
+            }
+        }
+        return status, headers, payload
+
+    def _reports(self, requests):
+        """Return a report for each report request, validating the batch."""
+        if not 0 < len(requests) <= MAX_REPORT_REQUESTS:
+            msg = f"A batch must have 1 to {MAX_REPORT_REQUESTS} report requests"
+            raise SimulatorError("badRequest", msg)
+
+        first = requests[0]
+        for request in requests:
+            for key in ("viewId", "dateRanges", "samplingLevel"):
+                if request.get(key) != first.get(key):
+                    msg = f"All report requests must have the same {key}"
+                    raise SimulatorError("badRequest", msg)
+        return [self._report(request) for request in requests]
+
+    def _report(self, request):
+        """Return one page of a synthetic report."""
+        metrics = [metric["expression"] for metric in request.get("metrics") or ()]
+        names = [dimension["name"] for dimension in request.get("dimensions") or ()]
+        if not 0 < len(metrics) <= MAX_METRICS:
+            msg = f"A report request must have 1 to {MAX_METRICS} metrics"
+            raise SimulatorError("badRequest", msg)
+        if len(names) > MAX_DIMENSIONS:
+            msg = f"A report request can have at most {MAX_DIMENSIONS} dimensions"
+            raise SimulatorError("badRequest", msg)
+
+        date_ranges = request.get("dateRanges") or [{}]
+        if len(date_ranges) > 2:
+            raise SimulatorError("badRequest", "At most 2 date ranges are allowed")
+        try:
+            days = [
+                (
+                    resolve_date(date_range.get("startDate", "7daysAgo")),
+                    resolve_date(date_range.get("endDate", "yesterday")),
+                )
+                for date_range in date_ranges
+            ]
+        except ValueError as err:
+            raise SimulatorError("badRequest", str(err))
+        start, end = days[0]
+        if start > end:
+            raise SimulatorError("badRequest", "startDate is after endDate")
+
+        time_dimensions = [
+            n
+            for n, name in enumerate(names)
+            if getattr(_dimensions.get(name), "time_format", None)
+        ]
+        periods = self._periods(start, end, [names[n] for n in time_dimensions])
+        other_dimensions = [n for n in range(len(names)) if n not in time_dimensions]
+        per_period = min(self.rows_per_day, self.cardinality ** len(other_dimensions))
+        row_count = len(periods) * per_period
+
+        page_size = int(request.get("pageSize") or 1000)
+        offset = int(request.get("pageToken") or 0)
+        formatting_types = [
+            getattr(_metrics.get(expression), "formatting_type", None)
+            or ("FLOAT" if any(op in expression for op in "+-*/") else "INTEGER")
+            for expression in metrics
+        ]
+
+        # Values depend on the view and time dimension values, not on where
+        # rows fall in the date range, so they don't change with the range.
+        view = _digest(request.get("viewId"))
+        period_keys = [_digest("/".join(period)) for period in periods]
+
+        rows = []
+        for k in range(offset, min(offset + page_size, row_count)):
+            period, j = divmod(k, per_period)
+            values = [None] * len(names)
+            for n, value in zip(time_dimensions, periods[period]):
+                values[n] = value
+            for i, n in enumerate(other_dimensions):
+                value = j // self.cardinality**i % self.cardinality
+                values[n] = f"{names[n][3:]} {value}"
+            rows.append(
+                {
+                    "dimensions": values,
+                    "metrics": [
+                        {
+                            "values": [
+                                _metric_value(
+                                    formatting_type,
+                                    _mix(self.seed, view, period_keys[period], j, r, m),
+                                )
+                                for m, formatting_type in enumerate(formatting_types)
+                            ]
+                        }
+                        for r in range(len(days))
+                    ],
+                }
+            )
+
+        today = datetime.date.today()
+        data = {
+            "rowCount": row_count,
+            "isDataGolden": end < today - datetime.timedelta(days=1),
+        }
+        if rows:
+            data["rows"] = rows
+        if self.sampling_threshold is not None:
+            space = (end - start).days + 1
+            space *= self.rows_per_day
+            if space > self.sampling_threshold:
+                data["samplesReadCounts"] = [str(self.sampling_threshold)]
+                data["samplingSpaceSizes"] = [str(space)]
+
+        report = {
+            "columnHeader": {
+                "dimensions": names,
+                "metricHeader": {
+                    "metricHeaderEntries": [
+                        {"name": expression, "type": formatting_type}
+                        for expression, formatting_type in zip(
+                            metrics, formatting_types
+                        )
+                    ]
+                },
+            },
+            "data": data,
+        }
+        if offset + page_size < row_count:
+            report["nextPageToken"] = str(offset + page_size)
+        return report
+
+    def _periods(self, start, end, names):
+        """Return the distinct time dimension values of days, in order."""
+        if not names:
+            return [()]
+        periods = []
+        day = start
+        while day <= end:
+            period = tuple(_time_value(name, day) for name in names)
+            if not periods or periods[-1] != period:
+                periods.append(period)
+            day += datetime.timedelta(days=1)
+        return periods
+
+
+def _handler(simulator):
+    """Return a request handler class serving a simulator."""
+
+    class Handler(http.server.BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self):
+            if self.path.split("?")[0] != BATCH_GET_PATH:
+                return self._send(404, {}, {"error": {"code": 404}})
+            length = int(self.headers.get("Content-Length", 0))
+            try:
+                body = json.loads(self.rfile.read(length))
+            except ValueError:
+                err = SimulatorError("badRequest", "Request body is not valid JSON")
+                return self._send(*simulator._error(err))
+            self._send(*simulator.batch_get(body))
+
+        def _send(self, status, headers, payload):
+            content = json.dumps(payload).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json; charset=UTF-8")
+            self.send_header("Content-Length", str(len(content)))
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(content)
+
+        def log_message(self, *args):
+            pass
+
+    return Handler
+
+
+def main(argv=None):
+    """Run the simulator until interrupted."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--rows-per-day", type=int, default=100)
+    parser.add_argument("--cardinality", type=int, default=100)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--latency-sigma", type=float, default=0.5)
+    parser.add_argument(
+        "--error",
+        action="append",
+        default=[],
+        metavar="REASON=RATE",
+        help="inject an error reason with a probability, e.g. backendError=0.01",
+    )
+    parser.add_argument("--max-concurrent", type=int, default=10)
+    parser.add_argument("--sampling-threshold", type=int)
+    parser.add_argument("--retry-after", type=int)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    errors = {}
+    for error in args.error:
+        reason, _, rate = error.partition("=")
+        if reason not in ERROR_STATUSES:
+            parser.error(f"unknown error reason {reason!r}")
+        errors[reason] = float(rate)
+
+    simulator = Simulator(
+        host=args.host,
+        port=args.port,
+        rows_per_day=args.rows_per_day,
+        cardinality=args.cardinality,
+        latency=args.latency,
+        latency_sigma=args.latency_sigma,
+        errors=errors,
+        max_concurrent=args.max_concurrent,
+        sampling_threshold=args.sampling_threshold,
+        retry_after=args.retry_after,
+        seed=args.seed,
+    )
+    simulator.start()
+    print(f"Serving {BATCH_GET_PATH} at {simulator.url}", flush=True)
+    try:
+        simulator._thread.join()
+    except KeyboardInterrupt:
+        simulator.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,35 @@
+"""Local stores of previously fetched report rows.
+
+A store is any object with ``load(key)`` and ``save(key, frame)`` methods,
+where ``frame`` is a report DataFrame and ``load`` returns None if nothing
+has been saved under ``key``.
+"""
+
+import os
+
+import pandas as pd
+
+
+class PickleStore:
+    """Store report DataFrames as pickle files in a directory."""
+
+    def __init__(self, path=".easy_gar_store"):
+        """Init PickleStore object."""
+        self.path = path
+        os.makedirs(path, exist_ok=True)
+
+    def _path(self, key):
+        return os.path.join(self.path, f"{key}.pkl")
+
+    def load(self, key):
+        """Return the DataFrame saved under key, or None."""
+        path = self._path(key)
+        if not os.path.exists(path):
+            return None
+        return pd.read_pickle(path)
+
+    def save(self, key, frame):
+        """Save a DataFrame under key."""
+        tmp_path = f"{self._path(key)}.tmp"
+        frame.to_pickle(tmp_path)
+        os.replace(tmp_path, self._path(key))
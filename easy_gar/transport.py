@@ -0,0 +1,181 @@
+"""Transports for Google Analytics Reporting API v4 batchGet calls.
+
+A transport is any object with a ``batch_get(body)`` method, which sends a
+batchGet request body and returns the response.
+"""
+
+import contextlib
+import hashlib
+import json
+import mmap
+import os
+import struct
+import threading
+import zlib
+
+import httplib2
+
+# Each cassette record is a header, followed by the compressed JSON of the
+# request and response. The header holds the request's digest and the
+# length of the compressed JSON.
+_HEADER = struct.Struct("<32sI")
+
+
+def request_digest(body):
+    """Return a digest of a batchGet request body, as used in cassettes."""
+    canonical = json.dumps(body, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).digest()
+
+
+class _HttpPool:
+    """Pool of authorized HTTP objects, shared between threads.
+
+    httplib2 objects are not thread-safe, so each request checks one out for
+    as long as it runs. Idle objects keep their connections alive for later
+    requests, from any thread, and at most ``size`` objects are created.
+    """
+
+    def __init__(self, credentials, size):
+        self._credentials = credentials
+        self._size = size
+        self._idle = []
+        self._created = 0
+        self._available = threading.Condition()
+
+    def _new(self):
+        """Return a new authorized HTTP object."""
+        http = httplib2.Http()
+        if self._credentials is not None:
+            http = self._credentials.authorize(http)
+        return http
+
+    @contextlib.contextmanager
+    def checkout(self):
+        """Hold an HTTP object for the block, waiting for one if need be."""
+        with self._available:
+            while not self._idle and self._created >= self._size:
+                self._available.wait()
+            http = self._idle.pop() if self._idle else None
+            if http is None:
+                self._created += 1
+
+        if http is None:
+            try:
+                http = self._new()
+            except BaseException:
+                with self._available:
+                    self._created -= 1
+                    self._available.notify()
+                raise
+
+        try:
+            yield http
+        finally:
+            with self._available:
+                self._idle.append(http)
+                self._available.notify()
+
+    def close(self):
+        """Close the connections of the idle HTTP objects."""
+        with self._available:
+            for http in self._idle:
+                for connection in http.connections.values():
+                    connection.close()
+                http.connections.clear()
+
+
+class ServiceTransport:
+    """Send batchGet requests with an analyticsreporting v4 service object.
+
+    Requests are sent over a pool of up to ``max_connections`` HTTP objects
+    authorized with ``credentials``, if any. A transport can be shared
+    between threads, and connections are reused across pages and reports.
+    """
+
+    def __init__(self, service, credentials, max_connections=16):
+        """Init ServiceTransport object."""
+        self.service = service
+        self._pool = _HttpPool(credentials, max_connections)
+
+    def batch_get(self, body):
+        """Return the response to a batchGet request body."""
+        request = self.service.reports().batchGet(body=body)
+        with self._pool.checkout() as http:
+            return request.execute(http=http)
+
+    def close(self):
+        """Close the idle connections of the transport."""
+        self._pool.close()
+
+
+class RecordTransport:
+    """Record the batchGet calls sent through another transport.
+
+    Each request and its response are appended to the cassette file at
+    ``path``, which a ``ReplayTransport`` can serve them from later.
+    """
+
+    def __init__(self, transport, path):
+        """Init RecordTransport object."""
+        self.transport = transport
+        self.path = path
+        self._lock = threading.Lock()
+
+    def batch_get(self, body):
+        """Return the response to a batchGet request body, recording both."""
+        response = self.transport.batch_get(body)
+        record = json.dumps(
+            {"request": body, "response": response}, separators=(",", ":")
+        )
+        data = zlib.compress(record.encode("utf-8"), 1)
+        with self._lock, open(self.path, "ab") as f:
+            f.write(_HEADER.pack(request_digest(body), len(data)))
+            f.write(data)
+        return response
+
+
+class ReplayTransport:
+    """Serve batchGet responses recorded in a cassette file.
+
+    The cassette is memory-mapped, and only the headers of its records are
+    read up front, so opening a large cassette is fast. A request that was
+    not recorded raises KeyError. If a request was recorded more than once,
+    the last response recorded is served.
+    """
+
+    def __init__(self, path):
+        """Init ReplayTransport object."""
+        self.path = path
+        self._offsets = {}
+        self._map = None
+
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size:
+                self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        offset = 0
+        size = len(self._map) if self._map is not None else 0
+        while offset < size:
+            digest, length = _HEADER.unpack_from(self._map, offset)
+            offset += _HEADER.size
+            self._offsets[digest] = (offset, length)
+            offset += length
+
+    def __len__(self):
+        """Return the number of distinct requests recorded."""
+        return len(self._offsets)
+
+    def batch_get(self, body):
+        """Return the recorded response to a batchGet request body."""
+        try:
+            offset, length = self._offsets[request_digest(body)]
+        except KeyError:
+            raise KeyError(f"No response recorded in {self.path} for request")
+        record = json.loads(zlib.decompress(self._map[offset:offset + length]))
+        return record["response"]
+
+    def close(self):
+        """Unmap the cassette file."""
+        if self._map is not None:
+            self._map.close()
+            self._map = None
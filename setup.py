@@ -11,7 +11,7 @@ author = 'David Amos'
 email = 'somacdivad@gmail.com'
 version = '1.0.0'
 classifiers = [
-    'Programming Language :: Python :: 3.6',
+    'Programming Language :: Python :: 3.7',
 ]
 copyright = "2018, %s " % author
 license = "MIT"
@@ -22,8 +22,8 @@ long_description = ''.join(readme)
 
 reqs = ['google-api-python-client==1.6.7', 'pandas==0.23.0']
 
-if sys.version_info < (3, 6):
-    raise ImportError("Python 3.6+ required.")
+if sys.version_info < (3, 7):
+    raise ImportError("Python 3.7+ required.")
 
 install_requires = ['google-api-python-client==1.6.7', 'pandas==0.23.0']
 
@@ -39,7 +39,9 @@ setup(
     long_description=long_description,
     classifiers=classifiers,
     install_requires=reqs,
-    packages=find_packages(),
+    extras_require={'async': ['aiohttp']},
+    packages=find_packages(exclude=['benchmarks', 'tests']),
+    package_data={'easy_gar': ['analyticsreporting.v4.json']},
     license=license,
     keywords='easyGAR, easy-ga-reporting',
 )
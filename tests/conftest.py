@@ -0,0 +1,37 @@
+"""Fixtures shared by the tests."""
+
+import pytest
+
+from easy_gar.base import ReportingAPI
+from easy_gar.limits import RequestLimiter
+from easy_gar.retry import RetryPolicy
+from easy_gar.transport import ServiceTransport
+from tests.fakes import FakeService
+
+START_DATE = "2024-01-01"
+END_DATE = "2024-01-10"
+
+
+@pytest.fixture
+def service():
+    """Return a fake reporting service with 10 values for each dimension."""
+    return FakeService(cardinality=10)
+
+
+@pytest.fixture
+def make_api(service):
+    """Return a factory of ReportingAPI objects for the fake service.
+
+    The API objects share a transport for the service. Each gets its own
+    limiter without a QPS limit to speak of, and retries after short
+    delays, so that tests run fast.
+    """
+    transport = ServiceTransport(service, None)
+
+    def make_api(view_id="1", **kwargs):
+        kwargs.setdefault("transport", transport)
+        kwargs.setdefault("limiter", RequestLimiter(qps=1000))
+        kwargs.setdefault("retry_policy", RetryPolicy(base_delay=0.001))
+        return ReportingAPI(view_id, **kwargs)
+
+    return make_api
@@ -0,0 +1,240 @@
+"""A fake of the Google Analytics Reporting API v4 for the tests."""
+
+import datetime
+from http.server import BaseHTTPRequestHandler, HTTPServer
+import json
+from socketserver import ThreadingMixIn
+import threading
+import time
+import zlib
+
+from apiclient.errors import HttpError
+import httplib2
+
+# Value formats of the time dimensions the fake reports on.
+TIME_FORMATS = {
+    "ga:date": "%Y%m%d",
+    "ga:yearWeek": "%Y%U",
+    "ga:isoYearIsoWeek": "%G%V",
+    "ga:yearMonth": "%Y%m",
+}
+
+
+def http_error(status, reason=None, retry_after=None):
+    """Return an HttpError like the API's."""
+    info = {"status": status}
+    if retry_after is not None:
+        info["retry-after"] = retry_after
+    content = {"error": {"code": status, "errors": []}}
+    if reason is not None:
+        content["error"]["errors"].append({"reason": reason})
+    return HttpError(httplib2.Response(info), json.dumps(content).encode("utf-8"))
+
+
+def _parse_date(value):
+    return datetime.datetime.strptime(value, "%Y-%m-%d").date()
+
+
+class FakeService:
+    """Fake analyticsreporting v4 service.
+
+    Reports have a row for each period of their time dimensions and each of
+    ``cardinality`` values of their other dimensions. A metric value is the
+    sum of a value for each day of the row, so any split of a date range
+    adds up to the same rows.
+
+    Calls raise the exceptions queued in ``errors``, one per call, and each
+    call records its body in ``calls``.
+    """
+
+    def __init__(self, cardinality=10):
+        """Init FakeService object."""
+        self.cardinality = cardinality
+        self.golden = True
+        self.latency = 0.0
+        self.sampling_threshold = None
+        self.opaque_tokens = False
+        self.empty_dates = set()
+        self.errors = []
+        self.calls = []
+        self.peak = {}
+        self._in_flight = {}
+        self._lock = threading.Lock()
+
+    def reports(self):
+        """Return the reports collection."""
+        return self
+
+    def batchGet(self, body):
+        """Return a batchGet request."""
+        return _Request(self, body)
+
+    def reports_requested(self):
+        """Return the number of report requests in all calls."""
+        return sum(len(body["reportRequests"]) for body in self.calls)
+
+    def _batch_get(self, body):
+        view_id = body["reportRequests"][0]["viewId"]
+        with self._lock:
+            self.calls.append(body)
+            error = self.errors.pop(0) if self.errors else None
+            in_flight = self._in_flight[view_id] = self._in_flight.get(view_id, 0) + 1
+            self.peak[view_id] = max(self.peak.get(view_id, 0), in_flight)
+        try:
+            time.sleep(self.latency)
+            if error is not None:
+                raise error
+            return {"reports": [self._report(r) for r in body["reportRequests"]]}
+        finally:
+            with self._lock:
+                self._in_flight[view_id] -= 1
+
+    def _report(self, request):
+        names = [dimension["name"] for dimension in request["dimensions"]]
+        metrics = [metric["expression"] for metric in request["metrics"]]
+        date_ranges = [
+            (_parse_date(r["startDate"]), _parse_date(r["endDate"]))
+            for r in request["dateRanges"]
+        ]
+        rows = self._rows(request["viewId"], names, metrics, date_ranges)
+        for order_by in reversed(request.get("orderBys", ())):
+            rows.sort(
+                key=_sort_key(order_by["fieldName"], names, metrics),
+                reverse=order_by.get("sortOrder") == "DESCENDING",
+            )
+
+        token = request.get("pageToken", "t0" if self.opaque_tokens else "0")
+        offset = token[1:] if self.opaque_tokens else token
+        if not offset.isdigit():
+            raise http_error(400, "badRequest")
+        offset = int(offset)
+        page_size = int(request.get("pageSize", 1000))
+
+        data = {"rowCount": len(rows), "isDataGolden": self.golden}
+        if rows:
+            data["rows"] = rows[offset:offset + page_size]
+        start, end = date_ranges[0]
+        days = (end - start).days + 1
+        threshold = self.sampling_threshold
+        if threshold is not None and days * self.cardinality > threshold:
+            data["samplesReadCounts"] = [str(threshold)]
+            data["samplingSpaceSizes"] = [str(days * self.cardinality)]
+
+        header = {
+            "dimensions": names,
+            "metricHeader": {
+                "metricHeaderEntries": [{"name": metric} for metric in metrics]
+            },
+        }
+        report = {"columnHeader": header, "data": data}
+        if offset + page_size < len(rows):
+            next_offset = str(offset + page_size)
+            report["nextPageToken"] = (
+                f"t{next_offset}" if self.opaque_tokens else next_offset
+            )
+        return report
+
+    def _rows(self, view_id, names, metrics, date_ranges):
+        """Return the rows of a report, sorted by dimension values."""
+        start, end = date_ranges[0]
+        others = [name for name in names if name not in TIME_FORMATS]
+        groups = {}
+        for n in range((end - start).days + 1):
+            day = start + datetime.timedelta(days=n)
+            if day.strftime("%Y%m%d") in self.empty_dates:
+                continue
+            for j in range(self.cardinality if others else 1):
+                key = tuple(
+                    day.strftime(TIME_FORMATS[name])
+                    if name in TIME_FORMATS
+                    else f"{name[3:]} {j}"
+                    for name in names
+                )
+                groups.setdefault(key, []).append((day, j))
+
+        rows = []
+        for key, days in sorted(groups.items()):
+            values = [
+                {
+                    "values": [
+                        str(sum(_value(view_id, day, j, m, r) for day, j in days))
+                        for m in metrics
+                    ]
+                }
+                for r in range(len(date_ranges))
+            ]
+            rows.append({"dimensions": list(key), "metrics": values})
+        return rows
+
+
+class _Request:
+    """Fake batchGet request."""
+
+    def __init__(self, service, body):
+        self._service = service
+        self._body = body
+
+    def execute(self, http=None):
+        """Return the response to the request."""
+        return self._service._batch_get(self._body)
+
+
+def _value(view_id, day, j, metric, date_range):
+    """Return the value of a metric for a day and dimension value."""
+    seed = f"{view_id}|{day}|{j}|{metric}|{date_range}".encode("utf-8")
+    return zlib.crc32(seed) % 100
+
+
+def _sort_key(field_name, names, metrics):
+    """Return a sort key for rows, by a dimension or metric."""
+    if field_name in names:
+        i = names.index(field_name)
+        return lambda row: row["dimensions"][i]
+    i = metrics.index(field_name)
+    return lambda row: int(row["metrics"][0]["values"][i])
+
+
+class FakeServer(ThreadingMixIn, HTTPServer):
+    """HTTP server answering batchGet calls with a FakeService.
+
+    Use it as a context manager, which serves requests on a background
+    thread at ``url``.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, service):
+        """Init FakeServer object on a free local port."""
+        super().__init__(("127.0.0.1", 0), _Handler)
+        self.service = service
+        self.url = f"http://127.0.0.1:{self.server_port}/v4/reports:batchGet"
+
+    def __enter__(self):
+        """Start serving requests."""
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc_info):
+        """Stop serving requests."""
+        self.shutdown()
+        self.server_close()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Request handler of FakeServer."""
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        try:
+            status, content = 200, self.server.service._batch_get(body)
+        except HttpError as err:
+            status, content = err.resp.status, json.loads(err.content)
+        payload = json.dumps(content).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
@@ -0,0 +1,105 @@
+"""Tests of the asyncio client."""
+
+import asyncio
+
+import pandas as pd
+import pytest
+
+from easy_gar import dimensions, metrics
+from easy_gar.base import ReportingAPI
+from easy_gar.limits import RequestLimiter
+from tests.conftest import END_DATE, START_DATE
+from tests.fakes import FakeServer
+
+aio = pytest.importorskip("easy_gar.aio")
+
+REPORTS = [
+    dict(
+        start_date=START_DATE,
+        end_date=END_DATE,
+        metrics=[metrics.sessions],
+        dimensions=[dimensions.date, dimensions.source],
+        page_size=30,
+    ),
+    dict(
+        start_date=START_DATE,
+        end_date="2024-01-05",
+        metrics=[metrics.users, metrics.pageviews],
+        dimensions=[dimensions.date],
+    ),
+]
+
+# A limiter without a QPS limit to speak of, so that tests run fast.
+FAST = RequestLimiter(qps=1000)
+
+
+def run(coroutine):
+    """Return the result of a coroutine run on a new event loop."""
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+def test_reports_match_sync_client(make_api, service):
+    expected = [make_api().get_report(**report).DataFrame for report in REPORTS]
+
+    async def get_reports(url):
+        async with aio.AsyncReportingAPI("1", url=url, limiter=FAST) as api:
+            single = [await api.get_report(**report) for report in REPORTS]
+            return single, await api.get_reports(REPORTS)
+
+    with FakeServer(service) as server:
+        single, batched = run(get_reports(server.url))
+    for report, frame in zip(single + batched, expected + expected):
+        pd.testing.assert_frame_equal(report.DataFrame, frame)
+
+
+def test_reports_with_many_metrics_are_split(make_api, service):
+    report = dict(REPORTS[0], metrics=list(metrics)[:12])
+    expected = make_api().get_report(**report).DataFrame
+    del service.calls[:]
+
+    async def get_report(url):
+        async with aio.AsyncReportingAPI("1", url=url, limiter=FAST) as api:
+            return await api.get_report(**report)
+
+    with FakeServer(service) as server:
+        frame = run(get_report(server.url)).DataFrame
+    pd.testing.assert_frame_equal(frame, expected)
+    assert [len(body["reportRequests"]) for body in service.calls] == [2] * 4
+
+
+def test_requests_wait_on_the_limiter(service):
+    service.latency = 0.02
+    limiter = RequestLimiter(max_concurrent=2, qps=1000)
+    reports = [dict(REPORTS[0], end_date=f"2024-01-0{n}") for n in range(1, 7)]
+
+    async def get_reports(url):
+        async with aio.AsyncReportingAPI("1", url=url, limiter=limiter) as api:
+            return await api.get_reports(reports)
+
+    with FakeServer(service) as server:
+        run(get_reports(server.url))
+    assert service.peak["1"] <= 2
+    assert limiter.stats()["1"].requests == len(service.calls)
+    assert limiter.stats()["1"].slot_wait > 0
+
+
+def test_report_for_views_matches_sync_client(make_api, service):
+    expected = make_api().get_report_for_views(["1", "2"], **REPORTS[0])
+
+    async def get_report_for_views(url):
+        async with aio.AsyncReportingAPI("1", url=url, limiter=FAST) as api:
+            return await api.get_report_for_views(["1", "2", "1"], **REPORTS[0])
+
+    with FakeServer(service) as server:
+        report = run(get_report_for_views(server.url))
+    pd.testing.assert_frame_equal(report.DataFrame, expected.DataFrame)
+    assert report.errors == {}
+
+
+def test_sync_methods_are_not_inherited():
+    assert not issubclass(aio.AsyncReportingAPI, ReportingAPI)
+    assert not hasattr(aio.AsyncReportingAPI, "_fetch_predicted_pages")
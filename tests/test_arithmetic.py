@@ -0,0 +1,59 @@
+"""Tests of computing metric arithmetic locally."""
+
+import numpy as np
+import pandas as pd
+
+from easy_gar import OrderBy, dimensions, metrics
+from easy_gar.base import _evaluate
+from tests.conftest import END_DATE, START_DATE
+
+REPORT = dict(
+    start_date=START_DATE,
+    end_date=END_DATE,
+    dimensions=[dimensions.date, dimensions.source],
+)
+
+
+def requested(body):
+    return [m["expression"] for m in body["reportRequests"][0]["metrics"]]
+
+
+def test_base_metrics_are_requested_once(make_api, service):
+    api = make_api()
+    per_user = metrics.sessions / metrics.users
+    engaged = metrics.sessions - metrics.bounces
+    frame = api.get_report(metrics=[per_user, engaged, metrics.users], **REPORT)
+    frame = frame.DataFrame
+    assert requested(service.calls[0]) == ["ga:sessions", "ga:users", "ga:bounces"]
+
+    base = [metrics.sessions, metrics.users, metrics.bounces]
+    expected = api.get_report(metrics=base, **REPORT).DataFrame
+    assert list(frame.columns) == [per_user.alias, engaged.alias, "Users"]
+    pd.testing.assert_series_equal(
+        frame[per_user.alias],
+        (expected["Sessions"] / expected["Users"])
+        .replace(np.inf, np.nan)
+        .rename(per_user.alias),
+    )
+    pd.testing.assert_series_equal(
+        frame[engaged.alias],
+        (expected["Sessions"] - expected["Bounces"]).rename(engaged.alias),
+    )
+
+
+def test_ordered_derived_metrics_are_sent_to_the_api(make_api, service):
+    per_user = metrics.sessions / metrics.users
+    order_by = [OrderBy(per_user, sort_order="DESCENDING")]
+    make_api().get_report(metrics=[per_user], order_by=order_by, **REPORT)
+    assert requested(service.calls[0]) == ["(ga:sessions)/ga:users"]
+
+
+def test_division_by_zero_gives_nan():
+    per_user = metrics.sessions / metrics.users
+    columns = {
+        "ga:sessions": np.array([3, 0, 1], dtype=np.int64),
+        "ga:users": np.array([2, 0, 0], dtype=np.int64),
+    }
+    np.testing.assert_array_equal(
+        _evaluate(per_user, columns), np.array([1.5, np.nan, np.nan])
+    )
@@ -0,0 +1,70 @@
+"""Tests of batching report requests."""
+
+import pandas as pd
+
+from easy_gar import dimensions, metrics
+from tests.conftest import END_DATE, START_DATE
+
+REPORTS = [
+    dict(
+        start_date=START_DATE,
+        end_date=END_DATE,
+        metrics=[metric],
+        dimensions=[dimensions.date, dimensions.source],
+    )
+    for metric in [
+        metrics.users,
+        metrics.new_users,
+        metrics.sessions,
+        metrics.bounces,
+        metrics.pageviews,
+        metrics.hits,
+        metrics.session_duration,
+    ]
+]
+
+
+def test_pages_are_joined(make_api, service):
+    service.cardinality = 5001
+    frame = make_api().get_report(**dict(REPORTS[0], end_date="2024-01-02")).DataFrame
+    assert len(frame) == 10002
+    assert frame.index.is_unique
+    assert list(frame.columns) == ["Users"]
+    assert len(service.calls) == 2
+
+
+def test_reports_match_get_report(make_api):
+    api = make_api()
+    reports = api.get_reports(REPORTS)
+    assert [report.DataFrame.columns[0] for report in reports] == [
+        spec["metrics"][0].alias for spec in REPORTS
+    ]
+    for report, spec in zip(reports, REPORTS):
+        expected = api.get_report(**spec).DataFrame
+        pd.testing.assert_frame_equal(report.DataFrame, expected)
+
+
+def test_more_than_five_reports_are_split_across_calls(make_api, service):
+    make_api().get_reports(REPORTS)
+    assert [len(body["reportRequests"]) for body in service.calls] == [5, 2]
+
+
+def test_reports_are_grouped_by_date_range(make_api, service):
+    specs = [
+        dict(spec, end_date="2024-01-05") if n % 2 else spec
+        for n, spec in enumerate(REPORTS)
+    ]
+    reports = make_api().get_reports(specs)
+    assert len(service.calls) == 2
+    for body in service.calls:
+        date_ranges = {repr(r["dateRanges"]) for r in body["reportRequests"]}
+        assert len(date_ranges) == 1
+    assert [len(report.DataFrame) for report in reports] == [100, 50] * 3 + [100]
+
+
+def test_pages_are_batched(make_api, service):
+    service.cardinality = 5001
+    specs = [dict(spec, end_date="2024-01-02") for spec in REPORTS[:2]]
+    reports = make_api().get_reports(specs)
+    assert [len(body["reportRequests"]) for body in service.calls] == [2, 2]
+    assert [len(report.DataFrame) for report in reports] == [10002, 10002]
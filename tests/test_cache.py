@@ -0,0 +1,109 @@
+"""Tests of caching responses."""
+
+import os
+import time
+
+import pandas as pd
+
+from easy_gar import dimensions, metrics
+from easy_gar.cache import DiskCache
+from tests.conftest import END_DATE, START_DATE
+
+REPORT = dict(
+    start_date=START_DATE,
+    end_date=END_DATE,
+    metrics=[metrics.sessions],
+    dimensions=[dimensions.date, dimensions.source],
+    page_size=30,
+)
+
+
+def report(golden, rows=10):
+    """Return a report as the API would, with some rows."""
+    data = {"rows": [{"dimensions": [str(n)]} for n in range(rows)]}
+    data["isDataGolden"] = golden
+    return {"data": data}
+
+
+def disk_size(path):
+    """Return the total size of the cache entries in a directory."""
+    return sum(e.stat().st_size for e in os.scandir(path) if e.name.endswith(".json"))
+
+
+def later(monkeypatch, seconds):
+    """Make time.time() return a time some seconds from now."""
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now + seconds)
+
+
+def test_cached_report_needs_no_requests(make_api, service, tmp_path):
+    api = make_api(cache=DiskCache(str(tmp_path)))
+    first = api.get_report(**REPORT).DataFrame
+    assert len(service.calls) == 4
+
+    second = api.get_report(max_workers=4, **REPORT).DataFrame
+    assert len(service.calls) == 4
+    pd.testing.assert_frame_equal(first, second)
+
+
+def test_other_views_are_not_served_from_cache(make_api, service, tmp_path):
+    make_api("1", cache=DiskCache(str(tmp_path))).get_report(**REPORT)
+    make_api("2", cache=DiskCache(str(tmp_path))).get_report(**REPORT)
+    assert len(service.calls) == 8
+
+
+def test_reports_expire_after_ttl(tmp_path, monkeypatch):
+    cache = DiskCache(str(tmp_path), ttl=60)
+    cache.set("key", report(golden=False))
+    assert cache.get("key") == report(golden=False)
+
+    later(monkeypatch, 61)
+    assert cache.get("key") is None
+    assert disk_size(str(tmp_path)) == cache._size == 0
+
+
+def test_golden_reports_never_expire(tmp_path, monkeypatch):
+    cache = DiskCache(str(tmp_path), ttl=60)
+    cache.set("key", report(golden=True))
+    later(monkeypatch, 10 ** 9)
+    assert cache.get("key") == report(golden=True)
+
+
+def test_reports_are_not_cached_without_ttl(tmp_path):
+    cache = DiskCache(str(tmp_path), ttl=0)
+    cache.set("key", report(golden=False))
+    cache.set("golden", report(golden=True))
+    assert cache.get("key") is None
+    assert cache.get("golden") == report(golden=True)
+
+
+def test_least_recently_used_reports_are_evicted(tmp_path):
+    path = str(tmp_path)
+    cache = DiskCache(path)
+    cache.set("a", report(golden=True))
+    entry_size = disk_size(path)
+    cache.max_size = 3 * entry_size
+    for n, key in enumerate("abc"):
+        cache.set(key, report(golden=True))
+        os.utime(cache._path(key), (1000 * (n + 1),) * 2)
+
+    assert cache.get("a") is not None
+    cache.set("d", report(golden=True))
+    assert cache.get("b") is None
+    assert all(cache.get(key) is not None for key in "acd")
+    assert disk_size(path) == cache._size == 3 * entry_size
+
+
+def test_size_is_counted_without_scanning(tmp_path, monkeypatch):
+    path = str(tmp_path)
+    DiskCache(path).set("a", report(golden=True))
+    cache = DiskCache(path)
+    assert cache._size == disk_size(path)
+
+    def scan():
+        raise AssertionError("scanned the cache directory")
+
+    monkeypatch.setattr(cache, "_entries", scan)
+    cache.set("a", report(golden=True, rows=20))
+    cache.set("b", report(golden=True))
+    assert cache._size == disk_size(path)
@@ -0,0 +1,49 @@
+"""Tests of the metric and dimension catalogs."""
+
+import pytest
+
+from easy_gar import dimensions, metrics
+
+
+@pytest.mark.parametrize("key", ["users", "ga:users", "Users"])
+def test_lookup_by_attribute_api_name_or_alias(key):
+    assert metrics[key] is metrics.users
+    assert metrics.get(key) is metrics.users
+    assert key in metrics
+
+
+def test_dimension_lookup():
+    assert dimensions["ga:date"] is dimensions.date
+    assert dimensions["Date"] is dimensions.date
+
+
+def test_unknown_field():
+    assert metrics.get("ga:nothing") is None
+    with pytest.raises(KeyError):
+        metrics["ga:nothing"]
+
+
+def test_goal_metrics_are_generated():
+    metric = metrics.goal20_abandon_rate
+    assert metric.expression == "ga:goal20AbandonRate"
+    assert metric.alias == "Goal 20 Abandonment Rate"
+    assert metric.formatting_type == "PERCENT"
+    assert len([m for m in metrics if m.expression.startswith("ga:goal1")]) == 66
+
+
+def test_catalog_fields_are_read_only():
+    with pytest.raises(AttributeError):
+        metrics.users.alias = "Visitors"
+    with pytest.raises(AttributeError):
+        dimensions.date.alias = "Day"
+    assert metrics.users.alias == "Users"
+
+
+def test_derived_metrics_are_mutable():
+    metric = metrics.sessions / metrics.users
+    metric.alias = "Sessions per User"
+    assert metric() == {
+        "expression": "(ga:sessions)/ga:users",
+        "alias": "Sessions per User",
+        "formattingType": "FLOAT",
+    }
@@ -0,0 +1,61 @@
+"""Tests of reporting a comparison date range."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from easy_gar import dimensions, metrics
+from tests.conftest import END_DATE, START_DATE
+
+REPORT = dict(
+    start_date=START_DATE,
+    end_date=END_DATE,
+    metrics=[metrics.sessions, metrics.users],
+    dimensions=[dimensions.date, dimensions.source],
+    compare_to=("2023-12-22", "2023-12-31"),
+)
+
+
+def test_comparison_columns_follow_their_metrics(make_api, service):
+    api = make_api()
+    frame = api.get_report(**REPORT).DataFrame
+    assert list(frame.columns) == [
+        "Sessions",
+        "Sessions (Comparison)",
+        "Users",
+        "Users (Comparison)",
+    ]
+    request = service.calls[0]["reportRequests"][0]
+    assert request["dateRanges"][1] == {
+        "startDate": "2023-12-22",
+        "endDate": "2023-12-31",
+    }
+
+    plain = dict(REPORT, compare_to=None)
+    expected = api.get_report(**plain).DataFrame
+    pd.testing.assert_frame_equal(frame[["Sessions", "Users"]], expected)
+    assert not frame["Sessions"].equals(frame["Sessions (Comparison)"])
+
+
+def test_derived_metrics_are_evaluated_per_range(make_api):
+    per_user = metrics.sessions / metrics.users
+    frame = make_api().get_report(**dict(REPORT, metrics=[per_user])).DataFrame
+    base = make_api().get_report(**REPORT).DataFrame
+    comparison = base["Sessions (Comparison)"] / base["Users (Comparison)"]
+    np.testing.assert_allclose(
+        frame[f"{per_user.alias} (Comparison)"],
+        comparison.replace(np.inf, np.nan),
+    )
+
+
+def test_split_reports_are_compared(make_api):
+    goals = [m for m in metrics if m.expression.startswith("ga:goal")][:12]
+    frame = make_api().get_report(**dict(REPORT, metrics=goals)).DataFrame
+    assert len(frame.columns) == 24
+    assert list(frame.columns[:2]) == [goals[0].alias, f"{goals[0].alias} (Comparison)"]
+
+
+def test_shards_cannot_be_compared(make_api, service):
+    with pytest.raises(ValueError):
+        make_api().get_report(shard_by="day", **REPORT)
+    assert service.calls == []
@@ -0,0 +1,31 @@
+"""Tests that importing easy_gar doesn't load heavy dependencies."""
+
+import subprocess
+import sys
+
+import pytest
+
+import easy_gar
+
+HEAVY_MODULES = ["pandas", "numpy", "googleapiclient", "oauth2client", "httplib2"]
+
+
+def test_import_loads_no_heavy_modules():
+    script = (
+        "import sys, easy_gar; "
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    output = subprocess.check_output([sys.executable, "-c", script])
+    assert output.decode("utf-8").strip() == ""
+
+
+def test_lazy_classes_resolve():
+    from easy_gar.base import Report, ReportingAPI
+
+    assert easy_gar.ReportingAPI is ReportingAPI
+    assert easy_gar.Report is Report
+
+
+def test_unknown_attribute_raises():
+    with pytest.raises(AttributeError):
+        easy_gar.NotAClass
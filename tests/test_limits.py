@@ -0,0 +1,63 @@
+"""Tests of limiting concurrent requests and requests per second."""
+
+import threading
+import time
+
+from easy_gar import dimensions, metrics
+from easy_gar.limits import RequestLimiter
+from tests.conftest import END_DATE, START_DATE
+
+REPORT = dict(
+    start_date=START_DATE,
+    end_date=END_DATE,
+    metrics=[metrics.sessions],
+    dimensions=[dimensions.date, dimensions.source],
+    page_size=10,
+)
+
+
+def test_concurrent_requests_are_limited_per_view(make_api, service):
+    service.latency = 0.02
+    limiter = RequestLimiter(max_concurrent=2, qps=1000)
+    make_api(limiter=limiter).get_report(max_workers=8, **REPORT)
+
+    assert len(service.calls) == 10
+    assert service.peak["1"] <= 2
+    assert limiter.stats()["1"].requests == 10
+    assert limiter.stats()["1"].slot_wait > 0
+
+
+def test_requests_per_second_are_limited():
+    limiter = RequestLimiter(qps=50, burst=1)
+
+    def request():
+        with limiter.acquire("1"):
+            pass
+
+    start = time.monotonic()
+    threads = [threading.Thread(target=request) for _ in range(11)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert time.monotonic() - start >= 0.19
+    assert limiter.stats()["1"].rate_wait > 0
+
+
+def test_limits_are_shared_through_lock_dir(tmp_path):
+    limiters = [
+        RequestLimiter(max_concurrent=1, qps=1000, lock_dir=str(tmp_path))
+        for _ in range(2)
+    ]
+    acquired = threading.Event()
+
+    def acquire():
+        with limiters[1].acquire("1"):
+            acquired.set()
+
+    with limiters[0].acquire("1"):
+        thread = threading.Thread(target=acquire)
+        thread.start()
+        assert not acquired.wait(0.1)
+    thread.join(1)
+    assert acquired.is_set()
@@ -0,0 +1,57 @@
+"""Tests of fetching paginated reports."""
+
+import pandas as pd
+
+from easy_gar import dimensions, metrics
+from tests.conftest import END_DATE, START_DATE
+from tests.fakes import http_error
+
+REPORT = dict(
+    start_date=START_DATE,
+    end_date=END_DATE,
+    metrics=[metrics.sessions, metrics.bounce_rate],
+    dimensions=[dimensions.date, dimensions.source],
+    page_size=15,
+)
+
+
+def test_pages_are_joined(make_api, service):
+    frame = make_api().get_report(**REPORT).DataFrame
+    assert len(frame) == 100
+    assert frame.index.is_unique
+    assert list(frame.columns) == ["Sessions", "Bounce Rate"]
+    assert len(service.calls) == 7
+
+
+def test_predicted_pages_match_serial_pages(make_api, service):
+    api = make_api()
+    serial = api.get_report(**REPORT).DataFrame
+    concurrent = api.get_report(max_workers=4, **REPORT).DataFrame
+    pd.testing.assert_frame_equal(serial, concurrent)
+    assert len(service.calls) == 14
+
+
+def test_opaque_page_tokens_are_followed(make_api, service):
+    api = make_api()
+    serial = api.get_report(**REPORT).DataFrame
+    service.opaque_tokens = True
+    concurrent = api.get_report(max_workers=4, **REPORT).DataFrame
+    pd.testing.assert_frame_equal(serial, concurrent)
+    assert len(service.calls) == 14
+
+
+def test_rejected_page_token_falls_back_to_serial(make_api, service):
+    api = make_api()
+    serial = api.get_report(**REPORT).DataFrame
+    service.errors = [None, None, http_error(400, "badRequest")]
+    concurrent = api.get_report(max_workers=1, **REPORT).DataFrame
+    pd.testing.assert_frame_equal(serial, concurrent)
+
+
+def test_iter_report_yields_each_page(make_api, service):
+    api = make_api()
+    frames = api.iter_report(**REPORT)
+    assert len(service.calls) == 0
+    frames = list(frames)
+    assert [len(frame) for frame in frames] == [15] * 6 + [10]
+    pd.testing.assert_frame_equal(pd.concat(frames), api.get_report(**REPORT).DataFrame)
@@ -0,0 +1,69 @@
+"""Tests of parsing responses into typed DataFrames."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from easy_gar import dimensions, metrics
+from tests.conftest import END_DATE, START_DATE
+
+REPORT = dict(
+    start_date=START_DATE,
+    end_date=END_DATE,
+    metrics=[metrics.sessions, metrics.bounce_rate, metrics.session_duration],
+    dimensions=[dimensions.date, dimensions.source],
+    page_size=30,
+)
+
+
+def test_metrics_are_typed_by_formatting_type(make_api):
+    frame = make_api().get_report(**REPORT).DataFrame
+    assert [dtype.kind for dtype in frame.dtypes] == ["i", "f", "m"]
+    assert len(frame) == 100
+
+
+def test_empty_report_has_typed_columns(make_api, service):
+    service.empty_dates = {"20240101"}
+    frame = make_api().get_report(**dict(REPORT, end_date=START_DATE)).DataFrame
+    assert len(frame) == 0
+    assert list(frame.columns) == ["Sessions", "Bounce Rate", "Session Duration"]
+    assert frame.dtypes.iloc[0] == np.int64
+
+
+def test_index_matches_row_tuples(make_api, service):
+    frame = make_api().get_report(**REPORT).DataFrame
+    rows = [
+        tuple(row["dimensions"])
+        for body in list(service.calls)
+        for report in service.batchGet(body).execute()["reports"]
+        for row in report["data"]["rows"]
+    ]
+    expected = pd.MultiIndex.from_tuples(rows, names=["Date", "Source"])
+    assert frame.index.equals(expected)
+    assert list(frame.index.names) == ["Date", "Source"]
+    assert [len(level) for level in frame.index.levels] == [10, 10]
+
+
+def test_dates_are_parsed(make_api):
+    report = dict(REPORT, parse_dates=True)
+    frame = make_api().get_report(**report).DataFrame
+    dates, sources = frame.index.levels
+    assert list(dates) == list(pd.date_range(START_DATE, END_DATE))
+    assert sources[0] == "source 0"
+
+
+@pytest.mark.parametrize(
+    "dimension, periods",
+    [
+        (dimensions.year_month, pd.period_range("2024-01", "2024-02", freq="M")),
+        (
+            dimensions.iso_year_iso_week,
+            pd.period_range("2024-01-01", "2024-02-11", freq="W-SUN"),
+        ),
+    ],
+)
+def test_months_and_iso_weeks_are_parsed_as_periods(make_api, dimension, periods):
+    report = dict(REPORT, end_date="2024-02-11", dimensions=[dimension])
+    frame = make_api().get_report(parse_dates=True, **report).DataFrame
+    assert list(frame.index.levels[0]) == list(periods)
+    assert frame.index.levels[0][0].start_time == pd.Timestamp("2024-01-01")
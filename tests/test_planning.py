@@ -0,0 +1,84 @@
+"""Tests of splitting reports with many metrics into joined requests."""
+
+import pandas as pd
+import pytest
+
+from easy_gar import OrderBy, dimensions, metrics
+from easy_gar.store import PickleStore
+from tests.conftest import END_DATE, START_DATE
+
+GOALS = [metric for metric in metrics if metric.expression.startswith("ga:goal")][:20]
+
+REPORT = dict(
+    start_date=START_DATE,
+    end_date=END_DATE,
+    metrics=GOALS,
+    dimensions=[dimensions.date, dimensions.source],
+)
+
+
+def test_metrics_are_split_and_joined(make_api, service):
+    api = make_api()
+    frame = api.get_report(**REPORT).DataFrame
+    assert list(frame.columns) == [metric.alias for metric in GOALS]
+    assert len(service.calls) == 1
+    assert service.reports_requested() == 2
+
+    halves = [
+        api.get_report(**dict(REPORT, metrics=GOALS[:10])).DataFrame,
+        api.get_report(**dict(REPORT, metrics=GOALS[10:])).DataFrame,
+    ]
+    pd.testing.assert_frame_equal(frame, pd.concat(halves, axis=1))
+
+
+def test_missing_rows_are_zero_filled(make_api, service):
+    report = service._report
+
+    def drop_rows(request):
+        # Leave out every third row of the part with the first goal.
+        response = report(request)
+        expressions = [metric["expression"] for metric in request["metrics"]]
+        if GOALS[0].expression in expressions:
+            rows = response["data"]["rows"]
+            response["data"]["rows"] = rows[1::3] + rows[2::3]
+        return response
+
+    service._report = drop_rows
+    frame = make_api().get_report(**REPORT).DataFrame
+    assert len(frame) == 100
+    assert (frame[GOALS[0].alias] == 0).sum() >= 33
+    assert frame.index.is_unique
+
+
+def test_get_reports_and_refresh_report_plan_metrics(make_api, tmp_path):
+    api = make_api()
+    expected = api.get_report(**REPORT).DataFrame
+    [report] = api.get_reports([REPORT])
+    pd.testing.assert_frame_equal(report.DataFrame, expected)
+    refreshed = api.refresh_report(PickleStore(str(tmp_path)), **REPORT)
+    pd.testing.assert_frame_equal(refreshed.DataFrame, expected)
+
+
+def test_ordered_metrics_go_in_the_first_request(make_api, service):
+    report = dict(REPORT, order_by=[OrderBy(GOALS[15], sort_order="DESCENDING")])
+    make_api().get_report(**report)
+    first, second = service.calls[0]["reportRequests"]
+    assert first["metrics"][0]["expression"] == GOALS[15].expression
+    assert first["orderBys"] and "orderBys" not in second
+
+
+def test_iter_report_rejects_split_reports(make_api, service):
+    with pytest.raises(ValueError):
+        make_api().iter_report(**REPORT)
+    assert service.calls == []
+
+
+def test_too_many_dimensions(make_api):
+    with pytest.raises(ValueError):
+        make_api().get_report(**dict(REPORT, dimensions=[dimensions.source] * 8))
+
+
+def test_explain(make_api, service):
+    plan = make_api().explain(max_workers=4, **REPORT)
+    assert plan.startswith("20 metrics, 2 dimensions: 2 report requests in 1 ")
+    assert service.calls == []
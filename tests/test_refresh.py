@@ -0,0 +1,72 @@
+"""Tests of refreshing reports from a local store."""
+
+import pandas as pd
+import pytest
+
+from easy_gar import OrderBy, dimensions, metrics
+from easy_gar.store import PickleStore
+from tests.conftest import END_DATE, START_DATE
+
+REPORT = dict(
+    start_date=START_DATE,
+    end_date="2024-02-15",
+    metrics=[metrics.sessions, metrics.bounce_rate],
+    dimensions=[dimensions.date, dimensions.source],
+)
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Return an empty store."""
+    return PickleStore(str(tmp_path))
+
+
+def test_refresh_matches_single_request(make_api, service, store):
+    api = make_api()
+    expected = api.get_report(**REPORT).DataFrame
+
+    api.refresh_report(store, **dict(REPORT, end_date="2024-01-20"))
+    calls = len(service.calls)
+    refreshed = api.refresh_report(store, refetch_days=2, **REPORT).DataFrame
+    pd.testing.assert_frame_equal(refreshed, expected)
+
+    # Only the last two stored days and the new days are fetched again.
+    assert len(service.calls) == calls + 1
+    date_range = service.calls[-1]["reportRequests"][0]["dateRanges"][0]
+    assert date_range == {"startDate": "2024-01-19", "endDate": "2024-02-15"}
+
+
+def test_stored_rows_are_reused(make_api, service, store):
+    api = make_api()
+    first = api.refresh_report(store, **REPORT).DataFrame
+    second = api.refresh_report(store, refetch_days=0, **REPORT).DataFrame
+    pd.testing.assert_frame_equal(first, second)
+    assert len(service.calls) == 1
+
+
+def test_dates_without_rows_are_not_fetched_again(make_api, service, store):
+    service.empty_dates = {"20240102", "20240105"}
+    report = dict(REPORT, end_date=END_DATE)
+    api = make_api()
+    frame = api.refresh_report(store, refetch_days=0, **report).DataFrame
+    assert len(frame) == 80
+
+    api.refresh_report(store, refetch_days=0, **report)
+    assert len(service.calls) == 1
+
+
+def test_start_after_end_is_rejected(make_api, service, store):
+    report = dict(REPORT, start_date="2024-02-15", end_date="2024-01-01")
+    with pytest.raises(ValueError):
+        make_api().refresh_report(store, **report)
+    assert service.calls == []
+
+
+def test_order_by_is_rejected(make_api, store):
+    with pytest.raises(TypeError):
+        make_api().refresh_report(store, order_by=[OrderBy(metrics.sessions)], **REPORT)
+
+
+def test_date_dimension_is_required(make_api, store):
+    with pytest.raises(ValueError):
+        make_api().refresh_report(store, **dict(REPORT, dimensions=[dimensions.source]))
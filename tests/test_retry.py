@@ -0,0 +1,80 @@
+"""Tests of retrying failed requests."""
+
+import asyncio
+import socket
+import time
+
+from apiclient.errors import HttpError
+import pytest
+
+from easy_gar import dimensions, metrics
+from easy_gar.retry import RetryPolicy, time_budget
+from tests.conftest import END_DATE, START_DATE
+from tests.fakes import http_error
+
+REPORT = dict(
+    start_date=START_DATE,
+    end_date=END_DATE,
+    metrics=[metrics.sessions],
+    dimensions=[dimensions.date],
+)
+
+
+@pytest.mark.parametrize(
+    "error, reason",
+    [
+        (http_error(403, "userRateLimitExceeded"), "userRateLimitExceeded"),
+        (http_error(500, "backendError"), "backendError"),
+        (http_error(503), "http503"),
+        (http_error(429), "http429"),
+        (http_error(400, "badRequest"), None),
+        (http_error(403, "forbidden"), None),
+        (ConnectionResetError(), "ConnectionResetError"),
+        (socket.timeout(), type(socket.timeout()).__name__),
+        (asyncio.TimeoutError(), type(asyncio.TimeoutError()).__name__),
+        (FileNotFoundError(), None),
+        (PermissionError(), None),
+        (ValueError(), None),
+    ],
+)
+def test_classify(error, reason):
+    assert RetryPolicy().classify(error) == reason
+
+
+def test_retry_after_is_waited_out():
+    policy = RetryPolicy(base_delay=0.001)
+    assert policy.next_delay(http_error(503, retry_after="2"), 0) == 2.0
+
+
+def test_gives_up_after_max_attempts():
+    policy = RetryPolicy(max_attempts=3)
+    assert policy.next_delay(http_error(503), 1) is not None
+    assert policy.next_delay(http_error(503), 2) is None
+
+
+def test_gives_up_at_deadline():
+    policy = RetryPolicy(base_delay=10, max_delay=10)
+    with time_budget(0.001):
+        time.sleep(0.002)
+        assert policy.next_delay(http_error(503), 0) is None
+    assert policy.counts()["deadline_exceeded"] == 1
+
+
+def test_transient_errors_are_retried(make_api, service):
+    service.errors = [http_error(500, "backendError")] * 3 + [None, None]
+    api = make_api(retry_policy=RetryPolicy(max_attempts=20, base_delay=0.001))
+    frame = api.get_report(page_size=2, **REPORT).DataFrame
+    assert len(frame) == 10
+
+    counts = api.retry_policy.counts()
+    assert counts["retries"] == counts["backendError"] == 3
+    assert counts["attempts"] == len(service.calls) == 8
+
+
+def test_bad_requests_are_not_retried(make_api, service):
+    service.errors = [http_error(400, "badRequest")]
+    api = make_api()
+    with pytest.raises(HttpError):
+        api.get_report(**REPORT)
+    assert len(service.calls) == 1
+    assert api.retry_policy.counts() == {"attempts": 1, "failures": 1}
@@ -0,0 +1,94 @@
+"""Tests of building and sharing the reporting service."""
+
+from concurrent.futures import ThreadPoolExecutor
+import threading
+
+import httplib2
+import pytest
+
+from easy_gar.base import ReportingAPI, _discovery_document
+from easy_gar.transport import ServiceTransport, _HttpPool
+from tests.fakes import FakeService
+
+
+def test_bundled_document_builds_the_service():
+    from apiclient.discovery import build_from_document
+
+    reporting = build_from_document(_discovery_document(), http=httplib2.Http())
+    request = reporting.reports().batchGet(body={})
+    assert request.uri.startswith(
+        "https://analyticsreporting.googleapis.com/v4/reports:batchGet"
+    )
+
+
+def test_instances_with_the_same_keys_share_a_transport(monkeypatch, tmp_path):
+    built = []
+
+    def build(api, secrets_path):
+        built.append(secrets_path)
+        return ServiceTransport(FakeService(), None)
+
+    monkeypatch.setattr(ReportingAPI, "_build_from_service_account_keys", build)
+    first, second = (tmp_path / "first.json", tmp_path / "second.json")
+    apis = [
+        ReportingAPI(view_id, str(path), "service")
+        for view_id, path in [("1", first), ("2", first), ("3", second)]
+    ]
+    assert built == [str(first), str(second)]
+    assert apis[0].transport is apis[1].transport
+    assert apis[0].transport is not apis[2].transport
+
+
+def test_http_objects_are_pooled():
+    pool = _HttpPool(None, 3)
+    seen, peak, in_use = set(), [0], [0]
+    lock = threading.Lock()
+
+    def request(_):
+        with pool.checkout() as http:
+            with lock:
+                seen.add(id(http))
+                in_use[0] += 1
+                peak[0] = max(peak[0], in_use[0])
+            threading.Event().wait(0.005)
+            with lock:
+                in_use[0] -= 1
+
+    for _ in range(3):
+        with ThreadPoolExecutor(8) as executor:
+            list(executor.map(request, range(20)))
+    assert len(seen) <= 3
+    assert peak[0] <= 3
+
+
+def test_close_closes_idle_connections():
+    pool = _HttpPool(None, 16)
+    with pool.checkout() as http:
+        pass
+    closed = []
+
+    class Connection:
+        def close(self):
+            closed.append(self)
+
+    http.connections["https:example.com"] = Connection()
+    pool.close()
+    assert len(closed) == 1
+    assert http.connections == {}
+
+
+def test_secrets_are_required_without_a_transport():
+    with pytest.raises(ValueError):
+        ReportingAPI("1")
+
+
+def test_close_closes_the_transport(make_api):
+    closed = []
+
+    class Transport:
+        def close(self):
+            closed.append(self)
+
+    make_api(transport=Transport()).close()
+    make_api(transport=object()).close()
+    assert len(closed) == 1
@@ -0,0 +1,62 @@
+"""Tests that split date ranges give the same rows as a single request."""
+
+import pandas as pd
+import pytest
+
+from easy_gar import dimensions, metrics
+from easy_gar.dates import split_date_range
+from tests.conftest import START_DATE
+
+REPORT = dict(
+    start_date=START_DATE,
+    end_date="2024-02-15",
+    metrics=[metrics.sessions, metrics.bounce_rate],
+    dimensions=[dimensions.date, dimensions.source],
+)
+
+
+def test_weeks_start_on_sunday():
+    assert split_date_range("2024-01-01", "2024-01-15", "week") == [
+        ("2024-01-01", "2024-01-06"),
+        ("2024-01-07", "2024-01-13"),
+        ("2024-01-14", "2024-01-15"),
+    ]
+
+
+@pytest.mark.parametrize("shard_by", ["day", "week", "month"])
+def test_shards_match_single_request(make_api, service, shard_by):
+    api = make_api()
+    expected = api.get_report(**REPORT).DataFrame
+    sharded = api.get_report(shard_by=shard_by, max_workers=4, **REPORT).DataFrame
+    pd.testing.assert_frame_equal(sharded, expected)
+    shards = {"day": 46, "week": 7, "month": 2}[shard_by]
+    assert len(service.calls) == 1 + shards
+
+
+def test_monthly_shards_by_year_month(make_api):
+    report = dict(REPORT, dimensions=[dimensions.year_month, dimensions.source])
+    api = make_api()
+    expected = api.get_report(**report).DataFrame
+    sharded = api.get_report(shard_by="month", **report).DataFrame
+    assert sharded.index.is_unique
+    assert len(expected) == 20
+    pd.testing.assert_frame_equal(sharded, expected)
+
+
+@pytest.mark.parametrize(
+    "shard_by, time_dimension",
+    [("day", None), ("day", dimensions.year_month), ("week", dimensions.year_month)],
+)
+def test_shards_need_a_fine_time_dimension(make_api, shard_by, time_dimension):
+    report = dict(REPORT, dimensions=[dimensions.source])
+    if time_dimension is not None:
+        report["dimensions"].append(time_dimension)
+    with pytest.raises(ValueError):
+        make_api().get_report(shard_by=shard_by, **report)
+
+
+def test_start_after_end_is_rejected(make_api, service):
+    report = dict(REPORT, start_date="2024-02-15", end_date="2024-01-01")
+    with pytest.raises(ValueError):
+        make_api().get_report(shard_by="day", **report)
+    assert service.calls == []
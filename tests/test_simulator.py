@@ -0,0 +1,76 @@
+"""Tests of requesting reports from the local API simulator."""
+
+import pandas as pd
+import pytest
+
+from easy_gar import dimensions, metrics
+from easy_gar.base import ReportingAPI
+from easy_gar.limits import RequestLimiter
+from easy_gar.retry import RetryPolicy
+from easy_gar.simulator import Simulator
+from tests.conftest import END_DATE, START_DATE
+
+REPORT = dict(
+    start_date=START_DATE,
+    end_date=END_DATE,
+    metrics=[metrics.sessions, metrics.bounce_rate],
+    dimensions=[dimensions.date, dimensions.source],
+)
+
+
+@pytest.fixture
+def simulator():
+    """Return a running simulator with 10 rows per day for each dimension."""
+    with Simulator(rows_per_day=10, cardinality=10) as simulator:
+        yield simulator
+
+
+def make_api(simulator, **kwargs):
+    kwargs.setdefault("limiter", RequestLimiter(qps=1000))
+    kwargs.setdefault("retry_policy", RetryPolicy(base_delay=0.001))
+    return ReportingAPI("1", api_endpoint=simulator.url, **kwargs)
+
+
+def test_reports_are_served(simulator):
+    api = make_api(simulator)
+    frame = api.get_report(page_size=30, **REPORT).DataFrame
+    assert len(frame) == 100
+    assert frame.index.is_unique
+    stats = simulator.stats()
+    assert stats["calls"] == 4
+    assert stats["rows"] == 100
+    api.close()
+
+
+def test_rate_limit_errors_are_retried(simulator):
+    simulator.errors = {"rateLimitExceeded": 0.5}
+    simulator.retry_after = 0
+    policy = RetryPolicy(max_attempts=20, base_delay=0.001)
+    api = make_api(simulator, retry_policy=policy)
+    frame = api.get_report(page_size=10, **REPORT).DataFrame
+    assert len(frame) == 100
+    assert simulator.stats()["errors"]["rateLimitExceeded"] > 0
+    api.close()
+
+
+def test_rows_match_across_date_ranges(simulator):
+    api = make_api(simulator)
+    expected = api.get_report(**REPORT).DataFrame
+    sharded = api.get_report(shard_by="day", max_workers=4, **REPORT).DataFrame
+    pd.testing.assert_frame_equal(sharded, expected)
+    api.close()
+
+
+def test_keys_are_used_when_given(simulator, monkeypatch, tmp_path):
+    built = []
+
+    def build(api, secrets_path):
+        built.append(secrets_path)
+        return api._build_without_keys(secrets_path)
+
+    monkeypatch.setattr(ReportingAPI, "_build_from_service_account_keys", build)
+    path = str(tmp_path / "secrets.json")
+    make_api(simulator, secrets_path=path, secrets_type="service").close()
+    assert built == [path]
+    with pytest.raises(ValueError):
+        make_api(simulator, secrets_path=path, secrets_type=None)
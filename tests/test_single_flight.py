@@ -0,0 +1,64 @@
+"""Tests of sharing identical requests that are in flight."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+from apiclient.errors import HttpError
+import pytest
+
+from easy_gar import dimensions, metrics
+from easy_gar.base import _SingleFlight
+from easy_gar.transport import ServiceTransport
+from tests.conftest import END_DATE, START_DATE
+from tests.fakes import FakeService, http_error
+
+REPORT = dict(
+    start_date=START_DATE,
+    end_date=END_DATE,
+    metrics=[metrics.sessions],
+    dimensions=[dimensions.date],
+)
+
+
+def in_threads(*apis):
+    with ThreadPoolExecutor(len(apis)) as executor:
+        futures = [
+            executor.submit(lambda api: api.get_report(**REPORT).DataFrame, api)
+            for api in apis
+        ]
+    return futures
+
+
+def test_identical_requests_share_one_call(make_api, service):
+    service.latency = 0.1
+    api = make_api()
+    futures = in_threads(api, api, make_api(), make_api())
+    assert len(service.calls) == 1
+    frames = [future.result() for future in futures]
+    assert all(frame.equals(frames[0]) for frame in frames)
+
+
+def test_errors_are_shared(make_api, service):
+    service.latency = 0.1
+    service.errors = [http_error(400)]
+    api = make_api()
+    futures = in_threads(api, api, api, api)
+    for future in futures:
+        with pytest.raises(HttpError):
+            future.result()
+    assert len(service.calls) == 1
+
+
+def test_other_transports_are_not_shared(make_api, service):
+    service.latency = 0.1
+    other_service = FakeService()
+    other = make_api(transport=ServiceTransport(other_service, None))
+    in_threads(make_api(), other)
+    assert len(service.calls) == 1
+    assert len(other_service.calls) == 1
+
+
+def test_keys_are_released():
+    flight = _SingleFlight()
+    assert flight.do("key", lambda: 1) == 1
+    assert flight.do("key", lambda: 2) == 2
+    assert flight._calls == {}
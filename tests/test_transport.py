@@ -0,0 +1,97 @@
+"""Tests of recording and replaying requests."""
+
+import pandas as pd
+import pytest
+
+from easy_gar import dimensions, metrics
+from easy_gar.transport import RecordTransport, ReplayTransport
+from tests.conftest import END_DATE, START_DATE
+
+GOALS = [metric for metric in metrics if metric.expression.startswith("ga:goal")][:12]
+
+REPORTS = [
+    dict(
+        start_date=START_DATE,
+        end_date=END_DATE,
+        metrics=[metrics.sessions, metrics.avg_session_duration],
+        dimensions=[dimensions.date, dimensions.source],
+        page_size=30,
+    ),
+    dict(
+        start_date=START_DATE,
+        end_date=END_DATE,
+        metrics=GOALS,
+        dimensions=[dimensions.date],
+    ),
+]
+
+
+@pytest.fixture
+def cassette(make_api, tmp_path):
+    """Return the path of a cassette of REPORTS, and the frames recorded."""
+    path = str(tmp_path / "reports.cassette")
+    api = make_api()
+    api.transport = RecordTransport(api.transport, path)
+    frames = [api.get_report(**report).DataFrame for report in REPORTS]
+    return path, frames
+
+
+def test_replay_matches_recording(make_api, service, cassette):
+    path, frames = cassette
+    calls = len(service.calls)
+    transport = ReplayTransport(path)
+    assert len(transport) == calls == 5
+
+    api = make_api(transport=transport)
+    for report, frame in zip(REPORTS, frames):
+        pd.testing.assert_frame_equal(api.get_report(**report).DataFrame, frame)
+        replayed = api.get_report(max_workers=4, **report).DataFrame
+        pd.testing.assert_frame_equal(replayed, frame)
+    assert len(service.calls) == calls
+    transport.close()
+
+
+def test_replay_batches_match_recording(make_api, cassette):
+    path, frames = cassette
+    transport = ReplayTransport(path)
+    api = make_api(transport=transport)
+    with pytest.raises(KeyError):
+        # get_reports batches requests differently from get_report.
+        api.get_reports(REPORTS)
+
+    [report] = api.get_reports(REPORTS[1:])
+    pd.testing.assert_frame_equal(report.DataFrame, frames[1])
+    transport.close()
+
+
+def test_relative_dates_are_matched_as_written(tmp_path):
+    class Transport:
+        def batch_get(self, body):
+            return {"reports": [{"data": {}}]}
+
+    path = str(tmp_path / "relative.cassette")
+    range_ = {"startDate": "7daysAgo", "endDate": "yesterday"}
+    body = {"reportRequests": [{"viewId": "1", "dateRanges": [range_]}]}
+    response = RecordTransport(Transport(), path).batch_get(body)
+
+    transport = ReplayTransport(path)
+    assert transport.batch_get(body) == response
+    transport.close()
+
+
+def test_unrecorded_request_raises_key_error(make_api, cassette):
+    path, _ = cassette
+    transport = ReplayTransport(path)
+    api = make_api(transport=transport)
+    with pytest.raises(KeyError):
+        api.get_report(**dict(REPORTS[0], end_date="2024-01-11"))
+    transport.close()
+
+
+def test_empty_cassette(tmp_path):
+    path = tmp_path / "empty.cassette"
+    path.write_bytes(b"")
+    transport = ReplayTransport(str(path))
+    assert len(transport) == 0
+    with pytest.raises(KeyError):
+        transport.batch_get({"reportRequests": []})
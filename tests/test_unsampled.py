@@ -0,0 +1,84 @@
+"""Tests of avoiding sampled data by splitting date ranges."""
+
+import pandas as pd
+import pytest
+
+from easy_gar import dimensions, metrics
+from easy_gar.dates import bisect_date_range
+from tests.conftest import END_DATE, START_DATE
+
+REPORT = dict(
+    start_date=START_DATE,
+    end_date=END_DATE,
+    metrics=[metrics.sessions],
+    dimensions=[dimensions.date, dimensions.source],
+)
+
+
+def test_bisect_date_range():
+    assert bisect_date_range("2024-01-01", "2024-01-10") == [
+        ("2024-01-01", "2024-01-05"),
+        ("2024-01-06", "2024-01-10"),
+    ]
+    assert bisect_date_range("2024-01-01", "2024-01-01") is None
+
+
+def test_sampled_ranges_are_split(make_api, service):
+    api = make_api()
+    expected = api.get_report(**REPORT).DataFrame
+
+    service.sampling_threshold = 30
+    del service.calls[:]
+    frame = api.get_report(unsampled=True, **REPORT).DataFrame
+    pd.testing.assert_frame_equal(frame, expected)
+    # 10 days are split into 5 and 5, then 3 and 2, and the first page of
+    # each unsampled range is reused.
+    assert len(service.calls) == 7
+
+
+def test_unsampled_ranges_are_not_split(make_api, service):
+    make_api().get_report(unsampled=True, **REPORT)
+    assert len(service.calls) == 1
+
+
+def test_sampled_days_are_returned_with_a_warning(make_api, service):
+    service.sampling_threshold = 5
+    report = dict(REPORT, end_date="2024-01-02")
+    with pytest.warns(UserWarning):
+        frame = make_api().get_report(unsampled=True, **report).DataFrame
+    assert len(frame) == 20
+
+
+def test_shards_are_split(make_api, service):
+    api = make_api()
+    expected = api.get_report(**REPORT).DataFrame
+    service.sampling_threshold = 30
+    frame = api.get_report(unsampled=True, shard_by="week", **REPORT).DataFrame
+    pd.testing.assert_frame_equal(frame, expected)
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        dict(dimensions=[dimensions.source, dimensions.year_month]),
+        dict(compare_to=("2023-12-22", "2023-12-31")),
+    ],
+)
+def test_unsampled_arguments_are_checked(make_api, service, kwargs):
+    with pytest.raises(ValueError):
+        make_api().get_report(unsampled=True, **dict(REPORT, **kwargs))
+    assert service.calls == []
+
+
+@pytest.mark.parametrize(
+    "argument", [dict(max_workers=4), dict(shard_by="day"), dict(unsampled=True)]
+)
+def test_get_reports_rejects_unbatched_arguments(make_api, argument):
+    with pytest.raises(ValueError):
+        make_api().get_reports([dict(REPORT, **argument)])
+
+
+def test_explain_accepts_unsampled(make_api, service):
+    plan = make_api().explain(unsampled=True, **REPORT)
+    assert "sampled responses are split" in plan
+    assert service.calls == []
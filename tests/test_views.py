@@ -0,0 +1,69 @@
+"""Tests of running one report across several views."""
+
+from apiclient.errors import HttpError
+import pandas as pd
+
+from easy_gar import dimensions, metrics
+from easy_gar.limits import RequestLimiter
+from tests.conftest import END_DATE, START_DATE
+from tests.fakes import http_error
+
+REPORT = dict(
+    start_date=START_DATE,
+    end_date=END_DATE,
+    metrics=[metrics.sessions],
+    dimensions=[dimensions.date, dimensions.source],
+    page_size=15,
+)
+
+
+def test_views_are_combined_in_order(make_api):
+    api = make_api()
+    report = api.get_report_for_views(["2", "1"], **REPORT)
+    frame = report.DataFrame
+    assert report.errors == {}
+    assert frame.index.names[0] == "View ID"
+    assert list(frame.index.levels[0].categories) == ["2", "1"]
+    for view_id in ["1", "2"]:
+        expected = make_api(view_id).get_report(**REPORT).DataFrame
+        assert frame.xs(view_id).equals(expected)
+
+
+def test_page_workers_are_passed_through(make_api, service):
+    api = make_api()
+    serial = api.get_report_for_views(["1", "2"], **REPORT).DataFrame
+    parallel = api.get_report_for_views(
+        ["1", "2"], max_views=2, max_workers=4, **REPORT
+    ).DataFrame
+    pd.testing.assert_frame_equal(serial, parallel)
+
+
+def test_repeated_views_are_fetched_once(make_api, service):
+    frame = make_api().get_report_for_views(["1", "2", "1"], **REPORT).DataFrame
+    assert list(frame.index.levels[0].categories) == ["1", "2"]
+    assert len(frame) == 200
+    assert len(service.calls) == 14
+
+
+def test_failed_views_are_reported(make_api, service):
+    report = service._report
+
+    def forbid(request):
+        if request["viewId"] == "2":
+            raise http_error(403, "forbidden")
+        return report(request)
+
+    service._report = forbid
+    report = make_api().get_report_for_views(["1", "2", "3"], **REPORT)
+    assert list(report.errors) == ["2"]
+    assert isinstance(report.errors["2"], HttpError)
+    assert list(report.DataFrame.index.levels[0].categories) == ["1", "3"]
+    assert len(report.DataFrame) == 200
+
+
+def test_views_have_separate_slots(make_api, service):
+    service.latency = 0.02
+    limiter = RequestLimiter(max_concurrent=1, qps=1000)
+    api = make_api(limiter=limiter)
+    api.get_report_for_views(["1", "2"], max_views=2, max_workers=2, **REPORT)
+    assert service.peak == {"1": 1, "2": 1}